@@ -14,6 +14,7 @@ from apps.web_app.server.constants import (
     RESOLUTION_LOOKBACK_BUFFER,
     SUPPORTED_RESOLUTIONS,
     YF_INTERVAL_LIMITS,
+    YF_QUOTE_THREADS,
 )
 from apps.web_app.server.utils import SymbolRecord, load_universe
 
@@ -110,26 +111,14 @@ class YFinanceSourceAdapter(SourceAdapter):
         if isinstance(df.columns, pd.MultiIndex):
             df.columns = df.columns.get_level_values(0)
 
-        df = df.rename(
-            columns={
-                "Open": "open",
-                "High": "high",
-                "Low": "low",
-                "Close": "close",
-                "Volume": "volume",
-            }
-        )
-        df = df.reset_index()
-        timestamp_col = next(
-            (name for name in ("Datetime", "Date") if name in df.columns),
-            None,
-        )
-        if timestamp_col is None:
+        # Read the yfinance columns and date index in place; renaming and
+        # reset_index() would each copy the whole history frame.
+        if df.index.name not in ("Datetime", "Date"):
             return []
 
-        timestamps = pd.to_datetime(df[timestamp_col], utc=True)
+        timestamps = pd.to_datetime(df.index, utc=True)
         if interval in {"1d", "1wk", "1mo"}:
-            timestamps = timestamps.dt.normalize()
+            timestamps = timestamps.normalize()
 
         bars: list[dict[str, Any]] = []
         for row, ts in zip(df.itertuples(index=False), timestamps):
@@ -137,14 +126,14 @@ class YFinanceSourceAdapter(SourceAdapter):
             if bar_time < from_ts * 1000 or bar_time >= to_ts * 1000:
                 continue
 
-            open_price = getattr(row, "open", None)
-            high_price = getattr(row, "high", None)
-            low_price = getattr(row, "low", None)
-            close_price = getattr(row, "close", None)
+            open_price = getattr(row, "Open", None)
+            high_price = getattr(row, "High", None)
+            low_price = getattr(row, "Low", None)
+            close_price = getattr(row, "Close", None)
             if any(value is None or (isinstance(value, float) and math.isnan(value)) for value in (open_price, high_price, low_price, close_price)):
                 continue
 
-            volume = getattr(row, "volume", None)
+            volume = getattr(row, "Volume", None)
             bars.append(
                 {
                     "time": bar_time,
@@ -210,7 +199,7 @@ class YFinanceSourceAdapter(SourceAdapter):
                 symbols_to_fetch.append(key)
 
         if symbols_to_fetch:
-            fetched_payloads = self._fetch_quote_batch([records_by_key[key] for key in symbols_to_fetch])
+            fetched_payloads = self._fetch_quote_batch([records_by_key[key] for key in symbols_to_fetch], now_utc)
             for key in symbols_to_fetch:
                 payload = fetched_payloads.get(key) or self._default_quote_payload(records_by_key[key])
                 self._quote_cache[key] = (now_utc, payload)
@@ -218,12 +207,19 @@ class YFinanceSourceAdapter(SourceAdapter):
 
         return quote_payloads
 
-    def _fetch_quote_batch(self, records: list[SymbolRecord]) -> dict[str, dict[str, Any]]:
+    def _fetch_quote_batch(
+        self,
+        records: list[SymbolRecord],
+        now_utc: datetime | None = None,
+    ) -> dict[str, dict[str, Any]]:
         if not records:
             return {}
 
-        start = (datetime.now(tz=timezone.utc) - timedelta(days=10)).strftime("%Y-%m-%d")
-        end = (datetime.now(tz=timezone.utc) + timedelta(days=1)).strftime("%Y-%m-%d")
+        # One clock read (the caller's, when given) so start/end can't straddle a UTC midnight
+        if now_utc is None:
+            now_utc = datetime.now(tz=timezone.utc)
+        start = (now_utc - timedelta(days=10)).strftime("%Y-%m-%d")
+        end = (now_utc + timedelta(days=1)).strftime("%Y-%m-%d")
         tickers = [record.yfinance_symbol for record in records]
         df = yf.download(
             tickers=tickers,
@@ -232,7 +228,7 @@ class YFinanceSourceAdapter(SourceAdapter):
             interval="1d",
             progress=False,
             auto_adjust=False,
-            threads=False,
+            threads=min(YF_QUOTE_THREADS, len(tickers)),
             group_by="ticker",
         )
 
@@ -79,3 +79,6 @@ YF_INTERVAL_LIMITS = {
     "1wk": timedelta(days=3650),
     "1mo": timedelta(days=3650),
 }
+
+# Worker threads yfinance uses to fetch a multi-ticker quote batch in parallel
+YF_QUOTE_THREADS = 16
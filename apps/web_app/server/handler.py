@@ -1,6 +1,6 @@
 """HTTP request handler — thin dispatcher that delegates to route modules."""
 from __future__ import annotations
-import json, mimetypes, re
+import json, logging, mimetypes, re
 from datetime import datetime
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler
@@ -14,6 +14,15 @@ from apps.web_app.server import routes_core, routes_announcements, routes_hedgef
 _INCLUDE_RE = re.compile(r'<!--\s*@include\s+([\w./\-]+)\s*-->')
 _assembled_index_cache: bytes | None = None
 
+# Access log: one FileHandler keeps server.log open instead of reopening it per request
+_access_log = logging.getLogger("tradingview-ui.access")
+_access_log.setLevel(logging.INFO)
+_access_log.propagate = False
+if not _access_log.handlers:
+    _access_handler = logging.FileHandler(SERVER_LOG_PATH, encoding="utf-8", delay=True)
+    _access_handler.setFormatter(logging.Formatter("%(message)s"))
+    _access_log.addHandler(_access_handler)
+
 def _assemble_index_html() -> bytes:
     """Read index.html and recursively replace @include markers with partial file contents."""
     index_path = APP_DIR / "index.html"
@@ -189,9 +198,6 @@ class AppRequestHandler(SimpleHTTPRequestHandler):
             pass
 
     def log_message(self, format, *args):
-        log_line = f"[{datetime.now().isoformat()}] [tradingview-ui] {self.address_string()} - {format % args}\n"
-        try:
-            with open(SERVER_LOG_PATH, "a") as f:
-                f.write(log_line)
-        except Exception:
-            pass
+        _access_log.info(
+            "[%s] [tradingview-ui] %s - %s", datetime.now().isoformat(), self.address_string(), format % args
+        )
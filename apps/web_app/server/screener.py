@@ -20,6 +20,7 @@ from apps.web_app.server.utils import normalize_symbol_name, sanitize_json_value
 from config.paths import SCREENER_DB  # noqa: E402
 
 _screener_refresh_guard = threading.Lock()
+_screener_write_lock = threading.Lock()
 _screener_refresh_inflight: set[str] = set()
 
 
@@ -102,22 +103,51 @@ def fetch_and_store_screener_snapshot(symbol: str) -> dict[str, Any]:
         raise RuntimeError(f"Refresh already in progress for {normalized}")
 
     try:
-        from packages.shared_db.db_utils import store_raw_json, upsert_company
+        from packages.shared_db.db_utils import (
+            close_connection,
+            flush_failed_companies,
+            store_raw_json,
+            upsert_company,
+        )
+        from packages.screener_client.cache import cache_mode
         from packages.screener_client.company_retry import scrape_company_with_retries
+        from packages.screener_client.http_client import new_client
 
         url = build_screener_company_url(normalized)
-        payload = asyncio.run(scrape_company_with_retries(url))
+
+        async def _scrape() -> dict[str, Any] | None:
+            # Each refresh runs in its own event loop, so it opens (and
+            # closes) its own client rather than leaving one per loop behind.
+            async with new_client() as client:
+                return await scrape_company_with_retries(url, client=client)
+
+        # A UI fetch/refresh must see live data, not the scraper's day-old cache
+        with cache_mode("off"):
+            payload = asyncio.run(_scrape())
         if not payload:
+            # Write the failed_companies row now instead of leaving it queued
+            # for the life of the server.
+            with _screener_write_lock:
+                try:
+                    flush_failed_companies()
+                finally:
+                    close_connection()
             raise RuntimeError(f"Failed to fetch Screener data for {normalized}")
 
         meta = payload.get("meta", {}) or {}
-        upsert_company(
-            meta.get("company_id"),
-            meta.get("warehouse_id"),
-            meta.get("company_name"),
-            url,
-        )
-        store_raw_json(meta.get("company_id"), url, payload)
+        with _screener_write_lock:
+            try:
+                upsert_company(
+                    meta.get("company_id"),
+                    meta.get("warehouse_id"),
+                    meta.get("company_name"),
+                    url,
+                )
+                store_raw_json(meta.get("company_id"), url, payload)
+            finally:
+                # Release the shared read-write handle so the read-only
+                # snapshot readers in this process can open the file.
+                close_connection()
 
         snapshot = load_latest_screener_snapshot(normalized)
         if snapshot is None:
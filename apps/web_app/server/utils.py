@@ -67,7 +67,8 @@ def load_universe() -> list[SymbolRecord]:
     df["company_name"] = df["company_name"].fillna("").astype(str).str.strip()
     df = df[df["symbol"] != ""]
 
+    unique = df[["symbol", "company_name"]].drop_duplicates()
     return [
-        SymbolRecord(symbol=row["symbol"], company_name=row["company_name"] or row["symbol"])
-        for _, row in df[["symbol", "company_name"]].drop_duplicates().iterrows()
+        SymbolRecord(symbol=symbol, company_name=company_name or symbol)
+        for symbol, company_name in zip(unique["symbol"].tolist(), unique["company_name"].tolist())
     ]
@@ -80,3 +80,5 @@ STRATEGY_DB = DB_DIR / "strategy_lab.duckdb"
 WATCHLISTS_JSON = APP_DATA_DIR / "watchlists.json"
 STRATEGY_EXPORT_DIR = APP_DATA_DIR / "strategy_exports"
 STRATEGY_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+SCREENER_CACHE_DIR = APP_DATA_DIR / "cache" / "screener"
+SCREENER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -1,29 +1,36 @@
 chart_configs = {
-    "price_dma_volume": ["Price", "DMA50", "DMA200", "Volume"],
-    "pe_eps": ["Price to Earning", "Median PE", "EPS"],
-    "margins_sales": ["GPM", "OPM", "NPM", "Quarter Sales"],
-    "ev_ebitda": ["EV Multiple", "Median EV Multiple", "EBITDA"],
-    "pbv": ["Price to book value", "Median PBV", "Book value"],
-    "mcap_sales": ["Market Cap to Sales", "Median Market Cap to Sales", "Sales"],
+    "price_dma_volume": ("Price", "DMA50", "DMA200", "Volume"),
+    "pe_eps": ("Price to Earning", "Median PE", "EPS"),
+    "margins_sales": ("GPM", "OPM", "NPM", "Quarter Sales"),
+    "ev_ebitda": ("EV Multiple", "Median EV Multiple", "EBITDA"),
+    "pbv": ("Price to book value", "Median PBV", "Book value"),
+    "mcap_sales": ("Market Cap to Sales", "Median Market Cap to Sales", "Sales"),
 }
 
-schedule_pl = [
+schedule_quarterly = (
     "Sales",
     "Expenses",
     "Other Income",
     "Net Profit",
-    "Material Cost %"
-]
+)
 
-schedule_bs = [
+schedule_pl = (
+    "Sales",
+    "Expenses",
+    "Other Income",
+    "Net Profit",
+    "Material Cost %",
+)
+
+schedule_bs = (
     "Borrowings",
     "Other Liabilities",
     "Fixed Assets",
     "Other Assets",
-]
+)
 
-schedule_cf = [
+schedule_cf = (
     "Cash from Operating Activity",
     "Cash from Investing Activity",
     "Cash from Financing Activity",
-]
+)
@@ -1,3 +1,4 @@
+import itertools
 import time
 import threading
 import pandas as pd
@@ -17,7 +18,13 @@ if str(ROOT_DIR) not in sys.path:
 from config.paths import UNIVERSE_CSV, DATA_DIR  # noqa: E402
 from packages.announcement_fetcher.pdf_utils import load_nse_announcement_to_dataframe  # noqa: E402
 from packages.announcement_fetcher.summarize import fetch_summarize_announcements_pdf  # noqa: E402
-from packages.shared_db.db_utils import store_announcement, get_processed_pdf_urls, get_symbols_with_min_market_cap  # noqa: E402
+from packages.shared_db.db_utils import (  # noqa: E402
+    get_announcements_connection,
+    get_processed_pdf_urls,
+    get_symbols_with_min_market_cap,
+    store_announcement,
+    store_announcements,
+)
 
 _fetcher_thread = None
 _fetcher_running = False
@@ -26,17 +33,25 @@ _processed_count = 0
 _current_company = ""
 _errors = []
 
-def process_special_announcements(row, pdf_url):
-    subject = str(row.get("Subject", "")).lower()
-    details = str(row.get("Details", ""))
-    company_name = str(row.get("Company_Name", ""))
-    broadcast_date = str(row.get("Broadcast_date", ""))
-    symbol = str(row.get("Symbols", ""))
-
-    if "financial result updates" in subject or "record date" in subject:
-        store_announcement(symbol, company_name, broadcast_date, pdf_url, details, "neutral")
-        return True
-    return False
+SPECIAL_SUBJECTS_PATTERN = "financial result updates|record date"
+
+def split_special_announcements(df_new):
+    """
+    Split out announcements that are stored as-is (no PDF summary) and return
+    (rows for store_announcements, remaining DataFrame).
+    """
+    special = df_new["Subject"].astype(str).str.lower().str.contains(SPECIAL_SUBJECTS_PATTERN)
+    df_special = df_new[special]
+    rows = list(zip(
+        df_special["Symbols"].astype(str),
+        df_special["Company_Name"].astype(str),
+        df_special["Broadcast_date"].astype(str),
+        df_special["Attachment_link"],
+        df_special["Details"].astype(str),
+        itertools.repeat("neutral"),
+        itertools.repeat(""),
+    ))
+    return rows, df_new[~special]
 
 def filter_unwanted_announcements(df_nse):
     df_unwanted_announcements = pd.read_csv(
@@ -84,6 +99,8 @@ def fetcher_loop():
     
     while _fetcher_running:
         print(f"[fetcher] Starting fetch cycle at {datetime.now()}")
+        # One announcements connection per cycle, shared by every write below
+        announcements_con = None
         try:
             # Refresh symbols from DB in case fundamentals have been updated
             symbols = get_symbols_with_min_market_cap(5000)
@@ -103,11 +120,20 @@ def fetcher_loop():
                 # Filter unwanted announcements
                 df_nse = filter_unwanted_announcements(df_nse)
                 
-                processed_set = get_processed_pdf_urls()
+                announcements_con = get_announcements_connection()
+                processed_set = get_processed_pdf_urls(con=announcements_con)
                 df_new = df_nse[~df_nse["Attachment_link"].isin(processed_set)]
                 _total_to_process = len(df_new)
                 _processed_count = 0
                 _errors = []
+
+                special_rows, df_new = split_special_announcements(df_new)
+                try:
+                    store_announcements(special_rows, con=announcements_con)
+                    _processed_count += len(special_rows)
+                except Exception as batch_error:
+                    print(f"[fetcher] Error storing special announcements: {batch_error}")
+                    _errors.append(f"Special announcements: {batch_error}")
                 
                 for _, row in df_new.iterrows():
                     if not _fetcher_running:
@@ -121,10 +147,6 @@ def fetcher_loop():
                     _current_company = company_name
                     
                     try:
-                        if process_special_announcements(row, pdf_url):
-                            _processed_count += 1
-                            continue
-                            
                         result = fetch_summarize_announcements_pdf(pdf_url, llm, broadcast_date, company_name)
                         if result:
                             store_announcement(
@@ -134,7 +156,8 @@ def fetcher_loop():
                                 pdf_url=pdf_url,
                                 summary=result.get("summary", ""),
                                 sentiment=result.get("sentiment", "neutral"),
-                                title=result.get("title", "")
+                                title=result.get("title", ""),
+                                con=announcements_con,
                             )
                         _processed_count += 1
                     except Exception as item_error:
@@ -150,6 +173,9 @@ def fetcher_loop():
             _errors.append(f"Cycle Error: {e}")
             if len(_errors) > 10:
                 _errors.pop(0)
+        finally:
+            if announcements_con is not None:
+                announcements_con.close()
             
         print(f"[fetcher] Sleeping for 10 minutes...")
         for _ in range(600):
@@ -83,8 +83,13 @@ def _parse_indian_number(value) -> float | None:
         return None
 
 
-def _load_screener_snapshot(ticker: str) -> dict | None:
-    """Load the latest Screener.in JSON snapshot for a ticker from DuckDB."""
+def _load_screener_snapshot(ticker: str, keys: tuple[str, ...] | None = None) -> dict | None:
+    """
+    Load the latest Screener.in JSON snapshot for a ticker from DuckDB.
+
+    With `keys`, only those top-level sections are extracted inside DuckDB
+    (json_extract) so Python never decodes the rest of the payload.
+    """
     if duckdb is None:
         return None
     try:
@@ -93,14 +98,25 @@ def _load_screener_snapshot(ticker: str) -> dict | None:
             return None
         normalized = ticker.strip().upper().replace(".NS", "")
         source_like = f"%/COMPANY/{normalized}/%"
+        if keys:
+            columns = ", ".join("json_extract(payload_json, ?)" for _ in keys)
+            params = [f'$."{key}"' for key in keys]
+        else:
+            columns, params = "payload_json", []
         with contextlib.closing(duckdb.connect(str(SCREENER_DB), read_only=True)) as con:
-            row = con.execute("""
-                SELECT payload_json FROM raw_company_json
+            row = con.execute(f"""
+                SELECT {columns} FROM raw_company_json
                 WHERE UPPER(source_url) LIKE ?
                 ORDER BY scraped_at DESC LIMIT 1
-            """, [source_like]).fetchone()
+            """, params + [source_like]).fetchone()
         if row is None:
             return None
+        if keys:
+            return {
+                key: json.loads(value) if isinstance(value, str) else value
+                for key, value in zip(keys, row)
+                if value is not None
+            }
         payload = json.loads(row[0]) if isinstance(row[0], str) else row[0]
         return payload
     except Exception as e:
@@ -171,8 +187,8 @@ def get_financial_metrics(
     if cached := _cache.get_financial_metrics(cache_key):
         return [FinancialMetrics(**m) for m in cached]
 
-    payload = _load_screener_snapshot(ticker)
-    if not payload:
+    payload = _load_screener_snapshot(ticker, keys=("summary", "ratios", "tables"))
+    if payload is None:
         return []
 
     normalized = ticker.strip().upper().replace(".NS", "")
@@ -465,7 +481,7 @@ def get_company_news(
 
 def get_market_cap(ticker: str, end_date: str, api_key: str = None) -> float | None:
     """Get market cap from Screener summary or yfinance."""
-    payload = _load_screener_snapshot(ticker)
+    payload = _load_screener_snapshot(ticker, keys=("summary",))
     if payload:
         summary = payload.get("summary", {}) or {}
         mcap = _parse_indian_number(summary.get("Market Cap"))
@@ -486,7 +502,7 @@ def get_market_cap(ticker: str, end_date: str, api_key: str = None) -> float | N
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
     df = pd.DataFrame([p.model_dump() for p in prices])
-    df["Date"] = pd.to_datetime(df["time"])
+    df["Date"] = pd.to_datetime(df["time"], format="%Y-%m-%d")
     df.set_index("Date", inplace=True)
     numeric_cols = ["open", "close", "high", "low", "volume"]
     for col in numeric_cols:
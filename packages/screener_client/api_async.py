@@ -1,21 +1,77 @@
 import asyncio
+import threading
 from typing import Any, Awaitable, Callable
 
 import httpx
 from httpx import HTTPStatusError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+from config.settings import chart_configs, schedule_bs, schedule_cf, schedule_pl, schedule_quarterly
+
 from .api_parsers import parse_peers_api, parse_screener_chart, parse_screener_schedule
-from .build_urls import build_chart_url, build_peers_url, build_schedule_url
-from .config import HEADERS, REQUEST_TIMEOUT
+from .build_urls import API_BASE, build_peers_url, chart_query, schedule_query
+from .cache import CHART_TTL, PEERS_TTL, SCHEDULE_TTL, cached_get
 from .helper import normalize_key
+from .ratelimit import SCREENER_LIMITER
 
 
-CONCURRENCY_LIMIT = 1
+CONCURRENCY_LIMIT = 6
 RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
-_sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
+# One semaphore per event loop, kept per thread: the web app runs each
+# refresh under its own asyncio.run() in its own thread, concurrently
+_sem_state = threading.local()
+_limiter = SCREENER_LIMITER
+
+# Per-company request templates, built once at import
+# Chart key -> encoded query string; only the company_id varies per request
+_CHART_QUERIES: dict[str, str] = {
+    key: chart_query(metrics, days=3652, consolidated=True) for key, metrics in chart_configs.items()
+}
+# (schedule key, percent_to_fraction, encoded query string)
+_SCHEDULE_SPECS: tuple[tuple[str, bool, str], ...] = tuple(
+    (
+        normalize_key(prefix, metric),
+        percent_to_fraction,
+        schedule_query(parent=metric, section=section, consolidated=True),
+    )
+    for prefix, section, percent_to_fraction, metrics in (
+        ("quarterly", "quarters", True, schedule_quarterly),
+        ("profit_loss", "profit-loss", True, schedule_pl),
+        ("balance_sheet", "balance-sheet", False, schedule_bs),
+        ("cash_flow", "cash-flow", False, schedule_cf),
+    )
+    for metric in metrics
+)
+
+
+def _json(response: httpx.Response, label: str) -> Any:
+    """
+    Decode a JSON body straight from bytes with orjson when available.
+    Returns None (and logs) when the body is not valid JSON.
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    except ValueError as error:  # json and orjson decode errors are ValueErrors
+        print(f"Invalid JSON for {label}: {error!r}")
+        return None
+
+
+def _get_sem() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    if getattr(_sem_state, "loop", None) is not loop:
+        _sem_state.loop = loop
+        _sem_state.sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
+    return _sem_state.sem
+
 
 async def _limited(coro_func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
-    async with _sem:
+    async with _get_sem():
         return await coro_func(*args, **kwargs)
 
 
@@ -51,12 +107,14 @@ async def _fetch_chart(
     client: httpx.AsyncClient,
     name: str,
     url: str,
-) -> tuple[str, list[dict[str, Any]]]:
+) -> tuple[str, str, list[dict[str, Any]]]:
+    label = f"chart:{name}"
     response = await _request_with_retries(
-        lambda: client.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT),
-        label=f"chart:{name}",
+        lambda: cached_get(client, url, CHART_TTL, _limiter),
+        label=label,
     )
-    return name, parse_screener_chart(response.json()) if response is not None else []
+    payload = _json(response, label) if response is not None else None
+    return "charts", name, parse_screener_chart(payload) if isinstance(payload, dict) else []
 
 
 async def _fetch_schedule(
@@ -65,83 +123,94 @@ async def _fetch_schedule(
     url: str,
     *,
     percent_to_fraction: bool,
-) -> tuple[str, list[dict[str, Any]]]:
+    period_dates: dict[str, str | None] | None = None,
+) -> tuple[str, str, list[dict[str, Any]]]:
+    label = f"schedule:{name}"
     response = await _request_with_retries(
-        lambda: client.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT),
-        label=f"schedule:{name}",
+        lambda: cached_get(client, url, SCHEDULE_TTL, _limiter),
+        label=label,
     )
-    if response is None:
-        return name, []
-    return name, parse_screener_schedule(
-        response.json(),
+    payload = _json(response, label) if response is not None else None
+    if not isinstance(payload, dict):
+        return "schedules", name, []
+    return "schedules", name, parse_screener_schedule(
+        payload,
         percent_to_fraction=percent_to_fraction,
+        period_dates=period_dates,
     )
 
 
 async def _fetch_peers_api(
     client: httpx.AsyncClient,
     warehouse_id: str | int,
-) -> tuple[str, tuple[list[dict[str, Any]], dict[str, Any] | None]]:
+) -> tuple[str, str, tuple[list[dict[str, Any]], dict[str, Any] | None]]:
     response = await _request_with_retries(
-        lambda: client.get(build_peers_url(warehouse_id), headers=HEADERS, timeout=REQUEST_TIMEOUT),
+        lambda: cached_get(client, build_peers_url(warehouse_id), PEERS_TTL, _limiter),
         label=f"peers:{warehouse_id}",
     )
-    return "peers_api", parse_peers_api(response.text) if response is not None else ([], None)
+    return "peers_api", "peers_api", parse_peers_api(response.text) if response is not None else ([], None)
 
 
 async def _fetch_api_data_for_company(
     company_id: str | int,
     warehouse_id: str | int | None,
+    client: httpx.AsyncClient,
+    missing_keys: set[str] | None = None,
 ) -> dict[str, Any]:
-    chart_configs = {
-        "price_dma_volume": ["Price", "DMA50", "DMA200", "Volume"],
-        "pe_eps": ["Price to Earning", "Median PE", "EPS"],
-        "margins_sales": ["GPM", "OPM", "NPM", "Quarter Sales"],
-        "ev_ebitda": ["EV Multiple", "Median EV Multiple", "EBITDA"],
-        "pbv": ["Price to book value", "Median PBV", "Book value"],
-        "mcap_sales": ["Market Cap to Sales", "Median Market Cap to Sales", "Sales"],
-    }
-    schedule_specs = (
-        [("quarterly", "quarters", True, metric) for metric in ["Sales", "Expenses", "Other Income", "Net Profit"]]
-        + [("profit_loss", "profit-loss", True, metric) for metric in ["Sales", "Expenses", "Other Income", "Net Profit", "Material Cost %"]]
-        + [("balance_sheet", "balance-sheet", False, metric) for metric in ["Borrowings", "Other Liabilities", "Fixed Assets", "Other Assets"]]
-        + [("cash_flow", "cash-flow", False, metric) for metric in ["Cash from Operating Activity", "Cash from Investing Activity", "Cash from Financing Activity"]]
-    )
-
-    charts = {key: [] for key in chart_configs}
-    schedules = {normalize_key(prefix, metric): [] for prefix, _, _, metric in schedule_specs}
+    """
+    Fetch every chart, schedule and peers endpoint for one company.
+
+    `client` should come from http_client.new_client() (its defaults carry
+    the Screener headers and timeout).
+
+    With `missing_keys`, only those chart/schedule keys (and peers, if
+    "peers_api" is in it) are requested, and the returned charts/schedules
+    contain just those keys; used to refetch what a previous attempt missed.
+    """
+    chart_queries = _CHART_QUERIES.items()
+    schedule_specs = _SCHEDULE_SPECS
+    if missing_keys is not None:
+        chart_queries = [(key, query) for key, query in chart_queries if key in missing_keys]
+        schedule_specs = [spec for spec in schedule_specs if spec[0] in missing_keys]
+        if "peers_api" not in missing_keys:
+            warehouse_id = None
+
+    charts = {key: [] for key, _ in chart_queries}
+    schedules = {key: [] for key, _, _ in schedule_specs}
     peers_api_records: list[dict[str, Any]] | None = None
-
-    async with httpx.AsyncClient() as client:
-        tasks: list[Awaitable[Any]] = [
-            _limited(
-                _fetch_chart,
-                client,
-                key,
-                build_chart_url(company_id, metrics, days=3652, consolidated=True),
-            )
-            for key, metrics in chart_configs.items()
-        ]
-        tasks.extend(
-            _limited(
-                _fetch_schedule,
-                client,
-                normalize_key(prefix, metric),
-                build_schedule_url(company_id, parent=metric, section=section, consolidated=True),
-                percent_to_fraction=percent_to_fraction,
-            )
-            for prefix, section, percent_to_fraction, metric in schedule_specs
+    # Every schedule of a company shares the same period labels
+    period_dates: dict[str, str | None] = {}
+
+    tasks: list[Awaitable[Any]] = [
+        _limited(
+            _fetch_chart,
+            client,
+            key,
+            f"{API_BASE}/{company_id}/chart/{query}",
         )
-        if warehouse_id is not None:
-            tasks.append(_limited(_fetch_peers_api, client, warehouse_id))
-
-        for key, payload in await asyncio.gather(*tasks):
-            if key in charts:
-                charts[key] = payload
-            elif key == "peers_api":
-                peers_api_records, _ = payload
-            else:
-                schedules[key] = payload
+        for key, query in chart_queries
+    ]
+    tasks.extend(
+        _limited(
+            _fetch_schedule,
+            client,
+            key,
+            f"{API_BASE}/{company_id}/schedules/{query}",
+            percent_to_fraction=percent_to_fraction,
+            period_dates=period_dates,
+        )
+        for key, percent_to_fraction, query in schedule_specs
+    )
+    if warehouse_id is not None:
+        tasks.append(_limited(_fetch_peers_api, client, warehouse_id))
+
+    # Results are tagged with their bucket, so dispatch is one dict lookup
+    buckets = {"charts": charts, "schedules": schedules}
+    for bucket, key, payload in await asyncio.gather(*tasks):
+        if bucket == "peers_api":
+            peers_api_records, _ = payload
+        else:
+            buckets[bucket][key] = payload
 
     return {
         "charts": charts,
@@ -1,29 +1,34 @@
 #api_parser
+import re
+from operator import itemgetter
 from typing import Any, Dict, Optional, Tuple, List
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from .helper import parse_numeric_value, period_to_date, maybe_number
 
+# Case-insensitive, stops at the first hit; no lowered copy of the body
+_TABLE_TAG_RE = re.compile(r"<table", re.IGNORECASE)
+
 
 def parse_screener_chart(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Robust chart parser: handles extra dict metadata fields in values,
     not just a single 'delivery' dict at index 2.
     """
-    datasets = payload.get("datasets", []) or []
+    datasets = payload.get("datasets")
+    if not datasets:
+        return []
     by_date: Dict[str, Dict[str, Any]] = {}
 
     for ds in datasets:
         metric_name = ds.get("metric") or ds.get("label") or "value"
-        values = ds.get("values", []) or []
+        # Keep only [date, value, ...] points with a date
+        values = [
+            pair for pair in ds.get("values") or ()
+            if isinstance(pair, (list, tuple)) and len(pair) >= 2 and pair[0]
+        ]
 
         for pair in values:
-            if not isinstance(pair, (list, tuple)) or len(pair) < 2:
-                continue
-
             date_str = pair[0]
-            if not date_str:
-                continue
-
             row = by_date.setdefault(date_str, {"Date": date_str})
 
             # Main value (index 1)
@@ -36,7 +41,9 @@ def parse_screener_chart(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
                         col = f"{metric_name}_{extra_key}"
                         row[col] = maybe_number(extra_val)
 
-    return [by_date[d] for d in sorted(by_date.keys())]
+    rows = list(by_date.values())
+    rows.sort(key=itemgetter("Date"))
+    return rows
 
 
 
@@ -44,10 +51,14 @@ def parse_screener_schedule(
     payload: Dict[str, Dict[str, Any]],
     *,
     percent_to_fraction: bool = False,
+    period_dates: Optional[Dict[str, Optional[str]]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Parse Screener schedule API JSON into a list-of-dicts.
 
+    `period_dates` is an optional period -> date cache shared across calls
+    (e.g. all schedules of one company); it is filled as periods are seen.
+
     Examples of payloads you showed:
 
     1) Single metric:
@@ -97,27 +108,37 @@ def parse_screener_schedule(
     periods = list(first_series.keys())  # preserve order from API
 
     rows: List[Dict[str, Any]] = []
+    if period_dates is None:
+        period_dates = {}
+
+    # Only dict-valued metrics become columns; filter once instead of per period
+    metric_series = [(name, series) for name, series in metrics if isinstance(series, dict)]
 
     for period in periods:
         row: Dict[str, Any] = {"Period": period}
-        date_str = period_to_date(period)
+        if period in period_dates:
+            date_str = period_dates[period]
+        else:
+            date_str = period_dates[period] = period_to_date(period)
         if date_str is not None:
             row["Date"] = date_str
 
-        for metric_name, series in metrics:
-            if not isinstance(series, dict):
-                continue
+        for metric_name, series in metric_series:
             raw_val = series.get(period)
-            val = parse_numeric_value(raw_val, percent_to_fraction=percent_to_fraction)
             # you can decide whether to keep NaNs or skip;
             # here we include them as None to keep the column present
-            row[metric_name] = val
+            row[metric_name] = parse_numeric_value(raw_val, percent_to_fraction=percent_to_fraction)
 
         rows.append(row)
 
     return rows
 
 
+def _cell_text(el) -> str:
+    """Text of an element, each text node stripped (same as bs4's get_text(strip=True))."""
+    return "".join(t.strip() for t in el.itertext())
+
+
 def _parse_html_peers_table(
     html: str,
 ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
@@ -126,56 +147,48 @@ def _parse_html_peers_table(
     rows: list[dict] for each company
     median_info: dict for 'Median: ...' row if present, else None
     """
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.find("table")
-    if not table:
+    table = next(lxml_html.fromstring(html).iter("table"), None)
+    if table is None:
         return [], None
 
     # Header row
-    header_cells = table.find("thead")
+    header_cells = table.find(".//thead")
     headers: List[str] = []
-    if header_cells:
-        tr = header_cells.find("tr")
-        if tr:
-            headers = [th.get_text(strip=True) for th in tr.find_all(["th", "td"])]
+    if header_cells is not None:
+        tr = header_cells.find(".//tr")
+        if tr is not None:
+            headers = [_cell_text(th) for th in tr.iter("th", "td")]
     else:
         # Fallback: use first row of tbody as header
-        first_tr = table.find("tr")
-        if first_tr:
-            headers = [
-                th.get_text(strip=True) for th in first_tr.find_all(["th", "td"])
-            ]
-            first_tr.extract()
+        first_tr = table.find(".//tr")
+        if first_tr is not None:
+            headers = [_cell_text(th) for th in first_tr.iter("th", "td")]
+            first_tr.drop_tree()
 
     rows: List[Dict[str, Any]] = []
     median_info: Optional[Dict[str, Any]] = None
 
     # Data rows
-    for tr in table.find_all("tr"):
-        cells = tr.find_all("td")
-        if not cells:
-            continue
+    n_headers = len(headers)
+    # The Median row is only recognised under a named first column
+    has_first_col = bool(headers and headers[0])
 
-        values = [c.get_text(strip=True) for c in cells]
-        # pad / trim to header length
-        if len(values) < len(headers):
-            values += [""] * (len(headers) - len(values))
-        elif len(values) > len(headers):
-            values = values[: len(headers)]
-
-        row_dict: Dict[str, Any] = dict(zip(headers, values))
-
-        # Detect Median row
-        first_col_name = headers[0] if headers else None
-        first_val = row_dict.get(first_col_name) if first_col_name else ""
-        if isinstance(first_val, str) and first_val.startswith("Median:"):
-            # store raw median row with numeric conversion applied where possible
-            median_info = {k: maybe_number(v) for k, v in row_dict.items()}
+    for tr in table.iter("tr"):
+        values = [_cell_text(c) for c in tr.iter("td")]
+        if not values:
             continue
 
-        # Convert numeric-looking values
-        for k, v in list(row_dict.items()):
-            row_dict[k] = maybe_number(v)
+        # pad to header length (zip trims the extras)
+        if len(values) < n_headers:
+            values += [""] * (n_headers - len(values))
+
+        # Convert numeric-looking values while building the row
+        row_dict: Dict[str, Any] = dict(zip(headers, map(maybe_number, values)))
+
+        # Detect Median row from the raw first cell
+        if has_first_col and values[0].startswith("Median:"):
+            median_info = row_dict
+            continue
 
         rows.append(row_dict)
 
@@ -196,33 +209,22 @@ def _parse_tsv_peers(
     rows: List[Dict[str, Any]] = []
     median_info: Optional[Dict[str, Any]] = None
 
+    n_header = len(header)
     for line in lines[1:]:
         parts = [p.strip() for p in line.split("\t")]
-        if not parts:
-            continue
+
+        # Normalize length (zip trims the extras)
+        if len(parts) < n_header:
+            parts += [""] * (n_header - len(parts))
+
+        # numeric conversion while building the row
+        row = dict(zip(header, map(maybe_number, parts)))
 
         # Detect median row
         if parts[0].startswith("Median:"):
-            # Normalize length
-            if len(parts) < len(header):
-                parts += [""] * (len(header) - len(parts))
-            elif len(parts) > len(header):
-                parts = parts[: len(header)]
-            median_raw = dict(zip(header, parts))
-            median_info = {k: maybe_number(v) for k, v in median_raw.items()}
+            median_info = row
             continue
 
-        # Normalize length
-        if len(parts) < len(header):
-            parts += [""] * (len(header) - len(parts))
-        elif len(parts) > len(header):
-            parts = parts[: len(header)]
-
-        row = dict(zip(header, parts))
-        # numeric conversion
-        for k, v in list(row.items()):
-            row[k] = maybe_number(v)
-
         rows.append(row)
 
     return rows, median_info
@@ -240,12 +242,11 @@ def parse_peers_api(text: str) -> Tuple[List[Dict[str, Any]], Optional[Dict[str,
 
     No pandas used anywhere.
     """
-    text = text.strip()
-    if not text:
+    if not text or text.isspace():
         return [], None
 
     # HTML path
-    if "<table" in text.lower():
+    if _TABLE_TAG_RE.search(text):
         try:
             return _parse_html_peers_table(text)
         except Exception:
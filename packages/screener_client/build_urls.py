@@ -1,44 +1,69 @@
 from urllib.parse import quote
 
 
-def build_chart_url(
-    company_id: str | int,
-    metrics: list[str] | str,
+API_BASE = "https://www.screener.in/api/company"
+
+
+def chart_query(
+    metrics: list[str] | tuple[str, ...] | str,
     *,
     days: int = 365,
     consolidated: bool = True,
 ) -> str:
     """
-    Build a Screener /chart/ API URL.
+    Encoded query string of a /chart/ URL. It does not depend on the company,
+    so fixed metric sets can build it once and reuse it.
     """
-    if isinstance(metrics, list):
+    if isinstance(metrics, (list, tuple)):
         metrics = "-".join(metrics)
 
     metrics_encoded = quote(metrics)
     consolidated_str = "true" if consolidated else "false"
 
-    return (
-        f"https://www.screener.in/api/company/{company_id}/chart/"
-        f"?q={metrics_encoded}&days={days}&consolidated={consolidated_str}"
-    )
+    return f"?q={metrics_encoded}&days={days}&consolidated={consolidated_str}"
 
 
-def build_schedule_url(
+def build_chart_url(
     company_id: str | int,
+    metrics: list[str] | tuple[str, ...] | str,
+    *,
+    days: int = 365,
+    consolidated: bool = True,
+) -> str:
+    """
+    Build a Screener /chart/ API URL.
+    """
+    return f"{API_BASE}/{company_id}/chart/{chart_query(metrics, days=days, consolidated=consolidated)}"
+
+
+def schedule_query(
     *,
     parent: str,
     section: str = "quarters",
     consolidated: bool = True,
 ) -> str:
     """
-    Build Screener /schedules/ API URL.
+    Encoded query string of a /schedules/ URL (company independent).
     """
     parent_encoded = quote(parent)
     consolidated_str = "true" if consolidated else "false"
 
+    return f"?parent={parent_encoded}&section={section}&consolidated={consolidated_str}"
+
+
+def build_schedule_url(
+    company_id: str | int,
+    *,
+    parent: str,
+    section: str = "quarters",
+    consolidated: bool = True,
+) -> str:
+    """
+    Build Screener /schedules/ API URL.
+    """
     return (
-        f"https://www.screener.in/api/company/{company_id}/schedules/"
-        f"?parent={parent_encoded}&section={section}&consolidated={consolidated_str}"
+        f"{API_BASE}/{company_id}/schedules/"
+        f"{schedule_query(parent=parent, section=section, consolidated=consolidated)}"
     )
 
 
@@ -46,7 +71,7 @@ def build_peers_url(warehouse_id: str | int) -> str:
     """
     Build Screener /peers/ API URL (uses warehouse_id).
     """
-    return f"https://www.screener.in/api/company/{warehouse_id}/peers/"
+    return f"{API_BASE}/{warehouse_id}/peers/"
 
 def screener_url_from_symbol(symbol: str) -> str:
     """
@@ -54,4 +79,4 @@ def screener_url_from_symbol(symbol: str) -> str:
     Example: RELIANCE → https://www.screener.in/company/RELIANCE/
     """
     sym = symbol.strip().upper()
-    return f"https://www.screener.in/company/{sym}/"
\ No newline at end of file
+    return f"https://www.screener.in/company/{sym}/"
@@ -0,0 +1,185 @@
+# screener_client/cache.py
+"""
+On-disk response cache for Screener company pages and API endpoints.
+
+Successful GET bodies are written to SCREENER_CACHE_DIR as
+<sha256(url)>.body (Content-Type, ETag and Last-Modified tab-separated on the
+first line, body after it); the file mtime is the fetch time, so freshness is
+a stat() against the caller's TTL. Retries and reruns within the TTL are
+served from disk, which means a 429 on one schedule no longer re-downloads
+the other fetched endpoints. Stale entries with a validator are revalidated
+with If-None-Match / If-Modified-Since, and a 304 serves the stored body.
+prune_cache() deletes entries older than MAX_TTL; scrape_from_csv runs it at
+the start of each cached run, and the directory can also be cleared by hand.
+
+Modes (set_cache_mode, or `with cache_mode("off"):` for one block; the mode
+is a ContextVar, so it follows asyncio tasks and stays per-thread):
+    "use"    - serve fresh entries, fetch and store misses (default)
+    "off"    - always hit the network, never read or write the cache
+    "replay" - serve entries regardless of age and never touch the network;
+               a miss raises CacheMiss (for offline runs and tests)
+"""
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+
+from config.paths import SCREENER_CACHE_DIR
+
+from .http_client import host_admission
+from .ratelimit import TokenBucket, parse_retry_after
+
+# Seconds a cached body stays fresh, per endpoint family
+PAGE_TTL = 24 * 3600
+CHART_TTL = 24 * 3600
+SCHEDULE_TTL = 24 * 3600
+PEERS_TTL = 3600
+# No entry older than this is fresh for any endpoint
+MAX_TTL = max(PAGE_TTL, CHART_TTL, SCHEDULE_TTL, PEERS_TTL)
+
+CACHE_MODES = ("use", "off", "replay")
+
+_mode: ContextVar[str] = ContextVar("screener_cache_mode", default="use")
+
+
+class CacheMiss(LookupError):
+    """Raised in replay mode when a URL has no cached body."""
+
+
+def _check_mode(mode: str) -> None:
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unknown cache mode {mode!r}; expected one of {CACHE_MODES}")
+
+
+def set_cache_mode(mode: str) -> None:
+    _check_mode(mode)
+    _mode.set(mode)
+
+
+def get_cache_mode() -> str:
+    return _mode.get()
+
+
+@contextmanager
+def cache_mode(mode: str) -> Iterator[None]:
+    """Use `mode` inside the block, then restore the previous one."""
+    _check_mode(mode)
+    token = _mode.set(mode)
+    try:
+        yield
+    finally:
+        _mode.reset(token)
+
+
+def _cache_path(url: str) -> Path:
+    return SCREENER_CACHE_DIR / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.body"
+
+
+# Stored response headers, in first-line order
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+# Stored validator -> conditional request header
+_VALIDATORS = (("ETag", "If-None-Match"), ("Last-Modified", "If-Modified-Since"))
+
+
+def _read(url: str) -> tuple[float, dict[str, str], bytes] | None:
+    """(mtime, stored headers, body) of the cache entry for `url`, or None."""
+    path = _cache_path(url)
+    try:
+        mtime = path.stat().st_mtime
+        head, _, body = path.read_bytes().partition(b"\n")
+    except FileNotFoundError:
+        return None
+    values = head.decode("latin-1").split("\t")
+    headers = {name: value for name, value in zip(_STORED_HEADERS, values) if value}
+    return mtime, headers, body
+
+
+def _cached_response(url: str, headers: dict[str, str], body: bytes) -> httpx.Response:
+    return httpx.Response(200, headers=headers, content=body, request=httpx.Request("GET", url))
+
+
+def _write(url: str, response: httpx.Response) -> None:
+    path = _cache_path(url)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    head = "\t".join(
+        " ".join(response.headers.get(name, "").split()) for name in _STORED_HEADERS
+    )
+    tmp.write_bytes(head.encode("latin-1", "ignore") + b"\n" + response.content)
+    os.replace(tmp, path)
+
+
+def prune_cache(max_age: float = MAX_TTL) -> int:
+    """
+    Delete cache entries (and leftover .tmp writes) not fetched or
+    revalidated within `max_age` seconds. Returns how many were removed.
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+    for path in SCREENER_CACHE_DIR.glob("*.body*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:  # pruned or replaced by another process
+            continue
+    return removed
+
+
+async def _network_get(
+    client: httpx.AsyncClient,
+    url: str,
+    limiter: TokenBucket | None,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    admission = host_admission(url)
+    async with admission:
+        if limiter is not None:
+            await limiter.acquire()
+        response = await client.get(url, headers=headers)
+    await admission.record(response.status_code)
+    if limiter is not None:
+        limiter.record(response.status_code, parse_retry_after(response.headers.get("Retry-After")))
+    return response
+
+
+async def cached_get(
+    client: httpx.AsyncClient,
+    url: str,
+    ttl: float,
+    limiter: TokenBucket | None = None,
+) -> httpx.Response:
+    """
+    client.get(url) through the cache; only 200 responses are stored.
+    Network requests (never cache hits) take a per-host slot and then a
+    `limiter` token. A stale entry is sent as a conditional GET; on 304 its
+    body is served and it counts as fresh for another `ttl`.
+    """
+    mode = _mode.get()
+    if mode == "off":
+        return await _network_get(client, url, limiter)
+
+    entry = _read(url)
+    if entry is not None:
+        mtime, headers, body = entry
+        if mode == "replay" or time.time() - mtime <= ttl:
+            return _cached_response(url, headers, body)
+    if mode == "replay":
+        raise CacheMiss(url)
+
+    conditional = (
+        {request_name: headers[name] for name, request_name in _VALIDATORS if name in headers}
+        if entry is not None
+        else {}
+    )
+    response = await _network_get(client, url, limiter, conditional or None)
+    if response.status_code == 304 and entry is not None:
+        os.utime(_cache_path(url))
+        return _cached_response(url, headers, body)
+    if response.status_code == 200:
+        _write(url, response)
+    return response
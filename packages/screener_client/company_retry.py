@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from typing import Any, Dict, Optional
 
 import httpx
 
+from .api_async import _fetch_api_data_for_company
+from .cache import cache_mode, get_cache_mode
 from .fetch import fetch_all_data
+from .http_client import new_client
+from .ratelimit import parse_retry_after
 
 # These are the schedule keys you consider "nice-to-have" (we'll only WARN on them now).
-IMPORTANT_SCHEDULE_KEYS = [
+IMPORTANT_SCHEDULE_KEYS = frozenset({
     "sales_quarterly",
     "expenses_quarterly",
     "other_income_quarterly",
@@ -27,7 +32,7 @@ IMPORTANT_SCHEDULE_KEYS = [
     "cash_from_operating_activity_cash_flow",
     "cash_from_investing_activity_cash_flow",
     "cash_from_financing_activity_cash_flow",
-]
+})
 
 
 def _has_missing_important_schedules(schedules: Dict[str, list[dict]]) -> bool:
@@ -35,49 +40,102 @@ def _has_missing_important_schedules(schedules: Dict[str, list[dict]]) -> bool:
     Return True if any important schedule key is missing OR has an empty list.
     Used now only for logging / diagnostics, not for re-scraping the whole company.
     """
-    for key in IMPORTANT_SCHEDULE_KEYS:
-        if key not in schedules or not schedules[key]:
-            return True
-    return False
+    if not IMPORTANT_SCHEDULE_KEYS <= schedules.keys():
+        return True
+    return not all(map(schedules.__getitem__, IMPORTANT_SCHEDULE_KEYS))
+
+
+async def _refetch_missing_schedules(
+    data: Dict[str, Any],
+    client: httpx.AsyncClient,
+) -> None:
+    """
+    Re-request only the important schedules that came back empty and merge
+    any non-empty results into data["schedules"] in place.
+    """
+    schedules = data.setdefault("schedules", {})
+    company_id = (data.get("meta") or {}).get("company_id")
+    schedules_get = schedules.get
+    missing = {key for key in IMPORTANT_SCHEDULE_KEYS if not schedules_get(key)}
+    if not missing or company_id is None:
+        return
+
+    # The empty bodies were just cached, so go to the network for the retry;
+    # replay runs stay offline and have nothing newer to offer.
+    if get_cache_mode() == "replay":
+        return
+
+    print(f"Refetching {len(missing)} empty schedule(s) for company {company_id}")
+    with cache_mode("off"):
+        refetched = await _fetch_api_data_for_company(company_id, None, client, missing_keys=missing)
+    for key, rows in refetched["schedules"].items():
+        if rows:
+            schedules[key] = rows
 
 
 def _is_unrecoverable(e: Exception) -> bool:
     """
     Return True if we should NOT retry this error.
 
-    We treat 400 / 403 / 404 as unrecoverable:
-      - 404 => symbol/company does not exist on Screener
+    We treat 400 / 403 / 404 / 410 as unrecoverable:
+      - 404/410 => symbol/company does not exist (or was removed) on Screener
       - 400/403 => bad request or forbidden (often not fixed by retry)
     """
     if isinstance(e, httpx.HTTPStatusError):
         status = e.response.status_code
-        if status in (400, 403, 404):
+        if status in (400, 403, 404, 410):
             return True
     return False
 
 
+def _retry_after(e: Exception) -> Optional[float]:
+    """Seconds from a 429/503 Retry-After header, if the server sent one."""
+    if isinstance(e, httpx.HTTPStatusError) and e.response.status_code in (429, 503):
+        return parse_retry_after(e.response.headers.get("Retry-After"))
+    return None
+
+
 async def scrape_company_with_retries(
     url: str,
     *,
+    client: Optional[httpx.AsyncClient] = None,
     max_attempts: int = 3,          # smaller, because we only retry on hard failures
-    delay_between_attempts: float = 30.0,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
 ) -> Dict[str, Any] | None:
     """
     Fetch full data for a company URL.
 
     Behaviour:
-      - If fetch_all_data raises an unrecoverable HTTP error (400/403/404):
+      - If fetch_all_data raises an unrecoverable HTTP error (400/403/404/410):
           -> record failure once, do NOT retry.
       - If fetch_all_data raises a recoverable error (e.g., 429/5xx/network):
-          -> retry up to max_attempts with delay_between_attempts.
+          -> retry up to max_attempts, waiting the server's Retry-After on
+             429/503 (capped at max_delay), else
+             min(max_delay, base_delay * 2**(attempt-1)) scaled
+             by a random 1..1+jitter factor so workers don't retry in step.
       - If fetch_all_data returns data (even with some schedules missing):
-          -> accept the data as-is, log a warning if schedules are missing,
+          -> refetch only the empty important schedules once, then accept
+             the data, log a warning if schedules are still missing,
              and DO NOT re-scrape the whole company.
 
     Returns:
         - dict with full data on success (possibly partial schedules)
         - None on final failure
     """
+    if client is None:
+        # Keep one client (and its pooled connections) across the attempts
+        async with new_client() as own_client:
+            return await scrape_company_with_retries(
+                url,
+                client=own_client,
+                max_attempts=max_attempts,
+                base_delay=base_delay,
+                max_delay=max_delay,
+                jitter=jitter,
+            )
+
     last_exception: Optional[Exception] = None
 
     # Import here to avoid circular imports
@@ -94,7 +152,7 @@ async def scrape_company_with_retries(
         print(f"Scraping {url} (attempt {attempt}/{max_attempts})")
 
         try:
-            data = await fetch_all_data(url)
+            data = await fetch_all_data(url, client)
         except Exception as e:
             last_exception = e
             print(f"Error: fetch_all_data failed for {url}: {e!r}")
@@ -110,16 +168,23 @@ async def scrape_company_with_retries(
 
             # Recoverable case (429/5xx/network): retry a few times then give up.
             if attempt < max_attempts:
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = min(max_delay, base_delay * 2 ** (attempt - 1)) * (1 + random.random() * jitter)
+                else:
+                    delay = min(max_delay, delay)  # don't let one header park a worker
                 print(
-                    f"Warning: Will retry {url} in {delay_between_attempts}s "
+                    f"Warning: Will retry {url} in {delay:.1f}s "
                     f"(attempt {attempt + 1}/{max_attempts})"
                 )
-                await asyncio.sleep(delay_between_attempts)
+                await asyncio.sleep(delay)
                 continue
             else:
                 break  # exit loop and mark failure below
 
-        # If we got here, fetch_all_data returned some data; we accept it even if partial.
+        # If we got here, fetch_all_data returned some data; give the empty
+        # schedules one targeted refetch, then accept it even if still partial.
+        await _refetch_missing_schedules(data, client)
         schedules = data.get("schedules", {}) or {}
         if _has_missing_important_schedules(schedules):
             print(
@@ -146,3 +211,4 @@ async def scrape_company_with_retries(
     print(f"Recorded failed company in DB for {url} (company_id=None)")
 
     return None
+
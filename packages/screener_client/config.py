@@ -7,4 +7,8 @@ HEADERS: Dict[str, str] = {
     )
 }
 
-REQUEST_TIMEOUT = 15  # seconds for HTTP requests
\ No newline at end of file
+REQUEST_TIMEOUT = 15  # seconds for HTTP requests
+
+# Token bucket shared by all Screener requests (see ratelimit.py)
+REQUESTS_PER_SECOND = 3.0
+REQUEST_BURST = 6
@@ -1,13 +1,18 @@
+import asyncio
 from typing import Any
 
+import httpx
+from lxml.html import HtmlElement
+
 from .api_async import _fetch_api_data_for_company
+from .http_client import new_client
 from .html_scraper import (
     async_get_soup,
     extract_about,
+    extract_all_tables,
     extract_company_and_warehouse,
     extract_pros_cons,
     extract_summary,
-    extract_table,
 )
 
 
@@ -21,16 +26,48 @@ TABLE_SECTIONS = {
 }
 
 
-async def fetch_all_data(url: str) -> dict[str, Any]:
-    soup = await async_get_soup(url)
-    company_id, warehouse_id = extract_company_and_warehouse(soup)
-    summary = extract_summary(soup)
-    api_data = (
-        await _fetch_api_data_for_company(company_id, warehouse_id)
+def _extract_page(tree: HtmlElement) -> dict[str, Any]:
+    """All HTML extractors for one company page (CPU-bound; run in a thread)."""
+    tables = extract_all_tables(tree, TABLE_SECTIONS.values())
+    return {
+        "summary": extract_summary(tree),
+        **{key: tables[heading] for key, heading in TABLE_SECTIONS.items()},
+        "analysis": {
+            **extract_pros_cons(tree),
+            "about": extract_about(tree),
+        },
+    }
+
+
+async def fetch_all_data(url: str, client: httpx.AsyncClient | None = None) -> dict[str, Any]:
+    if client is None:
+        # One-off call: open a client just for this company
+        async with new_client() as own_client:
+            return await fetch_all_data(url, own_client)
+
+    tree = await async_get_soup(url, client)
+    company_id, warehouse_id = extract_company_and_warehouse(tree)
+
+    # Start the API requests first, then parse the page in a worker thread
+    # while they are in flight
+    api_task = (
+        asyncio.create_task(_fetch_api_data_for_company(company_id, warehouse_id, client))
         if company_id is not None
-        else {"charts": {}, "schedules": {}, "peers_api": None}
+        else None
     )
+    try:
+        page = await asyncio.to_thread(_extract_page, tree)
+        api_data = (
+            await api_task
+            if api_task is not None
+            else {"charts": {}, "schedules": {}, "peers_api": None}
+        )
+    except BaseException:
+        if api_task is not None:
+            api_task.cancel()
+        raise
 
+    summary = page["summary"]
     return {
         "meta": {
             "company_id": company_id,
@@ -38,12 +75,7 @@ async def fetch_all_data(url: str) -> dict[str, Any]:
             "company_name": summary.get("company_name"),
             "source_url": url,
         },
-        "summary": summary,
-        **{key: extract_table(soup, heading) for key, heading in TABLE_SECTIONS.items()},
-        "analysis": {
-            **extract_pros_cons(soup),
-            "about": extract_about(soup),
-        },
+        **page,
         "peers_api": api_data.get("peers_api"),
         "charts": api_data.get("charts", {}) or {},
         "schedules": api_data.get("schedules", {}) or {},
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Any
 
 
@@ -17,6 +18,9 @@ MONTH_MAP = {
     "Dec": 12,
 }
 _NUM_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
+# Whole cell is a plain number with an optional trailing %, e.g. " 9.43% "
+_PLAIN_NUM_RE = re.compile(r"\s*([-+]?\d+(?:\.\d+)?)\s*(%?)\s*")
+_NUMBER_PUNCT = str.maketrans("", "", ",%")
 
 
 def parse_numeric_value(raw: Any, *, percent_to_fraction: bool) -> float | None:
@@ -25,7 +29,15 @@ def parse_numeric_value(raw: Any, *, percent_to_fraction: bool) -> float | None:
     if isinstance(raw, (int, float)):
         return float(raw)
 
-    text = str(raw).strip()
+    text = raw if isinstance(raw, str) else str(raw)
+    # Most cells are bare numbers: one anchored match, no strip/replace/search.
+    # Not a bare float(), which would also take "1e5", "1_000", ".5" and "inf"
+    plain = _PLAIN_NUM_RE.fullmatch(text)
+    if plain is not None:
+        value = float(plain.group(1))
+        return value / 100.0 if percent_to_fraction and plain.group(2) else value
+
+    text = text.strip()
     if not text or text in {"-", "NaN", "nan"}:
         return None
 
@@ -37,6 +49,8 @@ def parse_numeric_value(raw: Any, *, percent_to_fraction: bool) -> float | None:
     return value / 100.0 if percent_to_fraction and "%" in text else value
 
 
+# Period labels repeat across every schedule and company
+@lru_cache(maxsize=4096)
 def period_to_date(period: str) -> str | None:
     if not period:
         return None
@@ -66,10 +80,11 @@ def maybe_number(value: Any) -> Any:
         return None
 
     try:
-        return float(text.replace(",", "").replace("%", ""))
+        return float(text.translate(_NUMBER_PUNCT))
     except ValueError:
         return text
 
 
+@lru_cache(maxsize=1024)
 def normalize_key(prefix: str, label: str) -> str:
     return f"{label.lower().replace(' ', '_')}_{prefix}"
@@ -1,36 +1,114 @@
 # html_scraper.py
-from io import StringIO
-from typing import Any, Dict, List, Optional, Tuple
+"""
+Company-page extractors on an lxml.html tree.
+
+The page is parsed once by libxml2 and every extractor walks that C tree
+directly (iter / XPath), so no Python object is built for elements the
+extractors never touch.
+"""
+import copy
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pandas as pd
-import requests
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
 
+from .cache import PAGE_TTL, cached_get
 from .config import HEADERS, REQUEST_TIMEOUT
+from .ratelimit import SCREENER_LIMITER
 
 
-def get_soup(url: str) -> BeautifulSoup:
-    """Fetch a URL and return a BeautifulSoup object (synchronous)."""
-    resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+def _parse_page(content: bytes, encoding: Optional[str] = None) -> HtmlElement:
+    """
+    Parse a page with lxml. Raw bytes go straight to libxml2, decoded with
+    the response charset (UTF-8 when the server sends none).
+    """
+    try:
+        parser = lxml_html.HTMLParser(encoding=encoding or "utf-8")
+    except LookupError:  # a charset name libxml2 doesn't know, e.g. "latin-1"
+        try:
+            text = content.decode(encoding, errors="replace")
+        except LookupError:
+            text = content.decode("utf-8", errors="replace")
+        return lxml_html.document_fromstring(text)
+    return lxml_html.document_fromstring(content, parser=parser)
+
+
+# Recently parsed pages keyed by a digest of their bytes, so a company retry
+# (its page served again from the response cache) or a duplicate URL reuses
+# the tree instead of reparsing. Extractors only read from the tree.
+PARSED_PAGE_CACHE_SIZE = 16
+_parsed_pages: "OrderedDict[Tuple[bytes, str], HtmlElement]" = OrderedDict()
+_parsed_pages_lock = threading.Lock()
+
+
+def _parse_page_cached(content: bytes, encoding: Optional[str] = None) -> HtmlElement:
+    key = (hashlib.blake2b(content, digest_size=16).digest(), encoding or "utf-8")
+    with _parsed_pages_lock:
+        tree = _parsed_pages.get(key)
+        if tree is not None:
+            _parsed_pages.move_to_end(key)
+            return tree
+
+    tree = _parse_page(content, encoding)
+    with _parsed_pages_lock:
+        _parsed_pages[key] = tree
+        if len(_parsed_pages) > PARSED_PAGE_CACHE_SIZE:
+            _parsed_pages.popitem(last=False)
+    return tree
+
+
+def get_soup(url: str) -> HtmlElement:
+    """Fetch a URL and return its parsed lxml.html tree (synchronous)."""
+    resp = httpx.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT, follow_redirects=True)
     resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+    return _parse_page_cached(resp.content, resp.encoding)
 
 
-async def async_get_soup(url: str) -> BeautifulSoup:
+async def async_get_soup(url: str, client: httpx.AsyncClient) -> HtmlElement:
     """
-    Async version of get_soup using httpx.AsyncClient.
+    Async version of get_soup on the caller's pooled client (see
+    http_client.new_client()), served from the response cache when the
+    page was fetched within PAGE_TTL.
 
     Use this in async code (like fetch_all_data) so the HTML fetch
     does not block the event loop.
     """
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        return BeautifulSoup(resp.text, "html.parser")
+    resp = await cached_get(client, url, PAGE_TTL, SCREENER_LIMITER)
+    resp.raise_for_status()
+    return _parse_page_cached(resp.content, resp.encoding)
+
+
+def _text(el: HtmlElement, sep: str = "") -> str:
+    """Stripped, non-empty text pieces joined by `sep` (BeautifulSoup's get_text(sep, strip=True))."""
+    return sep.join(t for t in (piece.strip() for piece in el.itertext()) if t)
+
+
+def _find_by_class(el: HtmlElement, tag: str, cls: str) -> Optional[HtmlElement]:
+    """First descendant <tag> carrying the class token `cls`."""
+    # A plain attribute split; HtmlElement.classes builds a set wrapper per element
+    for child in el.iterdescendants(tag):
+        classes = child.get("class")
+        if classes and cls in classes.split():
+            return child
+    return None
+
+
+# Compiled once at import rather than on every .xpath() call. First-match
+# class lookups stay in Python above, since they stop at the first hit, while
+# libxml2 evaluates the full node-set before applying [1].
+_TABLE_AFTER = etree.XPath("(descendant::table | following::table)[1]")
+_IDS_DIV = etree.XPath("(//div[@data-company-id][@data-warehouse-id])[1]")
+_COMPANY_ID_DIV = etree.XPath("(//div[@data-company-id])[1]")
+_WAREHOUSE_ID_DIV = etree.XPath("(//div[@data-warehouse-id])[1]")
 
 
-def extract_summary(soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+def extract_summary(tree: HtmlElement) -> Dict[str, Optional[str]]:
     """
     Extract high-level summary from company page:
     - company_name
@@ -38,62 +116,264 @@ def extract_summary(soup: BeautifulSoup) -> Dict[str, Optional[str]]:
     """
     summary: Dict[str, Optional[str]] = {}
 
-    name_tag = soup.find("h1")
-    summary["company_name"] = name_tag.get_text(strip=True) if name_tag else None
+    name_tag = next(tree.iter("h1"), None)
+    summary["company_name"] = _text(name_tag) if name_tag is not None else None
 
-    ratios_block = soup.select_one(".company-ratios")
-    if ratios_block:
-        for li in ratios_block.select("li"):
-            key_el = li.find("span", {"class": "name"})
-            val_el = li.find("span", {"class": "value"})
-            if key_el and val_el:
-                key = key_el.get_text(strip=True)
-                val = val_el.get_text(strip=True)
-                summary[key] = val
+    ratios_block = _find_by_class(tree, "*", "company-ratios")
+    if ratios_block is not None:
+        for li in ratios_block.iterdescendants("li"):
+            key_el = _find_by_class(li, "span", "name")
+            val_el = _find_by_class(li, "span", "value")
+            if key_el is not None and val_el is not None:
+                summary[_text(key_el)] = _text(val_el)
 
     return summary
 
 
-def _extract_table_df(soup: BeautifulSoup, header_text: str) -> pd.DataFrame:
-    """
-    Internal helper:
-    - Finds table following header_text
-    - Parses via pandas
-    - Normalizes first column as 'Item'
-    """
-    heading = soup.find(
-        lambda tag: tag.name in ["h2", "h3", "h4"]
-        and header_text.lower() in tag.get_text(strip=True).lower()
-    )
-    if not heading:
-        return pd.DataFrame()
+# pandas' default na_values: read_html reads these cells as NaN
+_NA_TEXTS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+# read_html(thousands=",") drops the commas of cells shaped like this...
+_THOUSANDS_RE = re.compile(r"[-+]?(?:[0-9]+,|[0-9])*(?:\.[0-9]*)?(?:[0-9]?[eE]-?[0-9]+)?")
+# ...then types a column int, float or bool when every filled cell parses
+_INT_RE = re.compile(r"[-+]?[0-9]+")
+_FLOAT_RE = re.compile(
+    r"[-+]?(?:(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?|inf(?:inity)?)", re.IGNORECASE
+)
+_BOOL_TEXTS = {"True": True, "TRUE": True, "true": True, "False": False, "FALSE": False, "false": False}
 
-    table = heading.find_next("table")
-    if table is None:
-        return pd.DataFrame()
 
-    try:
-        df = pd.read_html(StringIO(str(table)))[0]
-    except Exception:
-        return pd.DataFrame()
+# read_html's whitespace normalization (a lone &nbsp; is kept)
+_CELL_WS_RE = re.compile(r"[\r\n]+|\s{2,}")
 
-    if df.empty:
-        return df
+# Row and cell selection of read_html's lxml parser
+_THEADS = etree.XPath(".//thead")
+_TBODY_ROWS = etree.XPath(".//tbody//tr")
+_ROOT_ROWS = etree.XPath("./tr")
+_TFOOT_ROWS = etree.XPath(".//tfoot//tr")
+_ROW_CELLS = etree.XPath("./td|./th")
+_STYLED = etree.XPath(".//style | .//*[@style]")
 
-    # Normalize first column name to 'Item'
-    first_col = df.columns[0]
-    df.rename(columns={first_col: "Item"}, inplace=True)
 
-    # Drop rows that are fully NaN except Item
-    if len(df.columns) > 1:
-        df.dropna(axis=0, how="all", subset=df.columns[1:], inplace=True)
+def _is_hidden(el: HtmlElement) -> bool:
+    return "display:none" in el.get("style", "").replace(" ", "")
 
-    df["Item"] = df["Item"].astype(str).str.strip()
-    df.reset_index(drop=True, inplace=True)
-    return df
+
+def _displayed_table(table: HtmlElement) -> Optional[HtmlElement]:
+    """
+    The table as read_html(displayed_only=True) sees it: None when it is
+    hidden, else a copy without <style> and display:none elements (the table
+    itself when it has neither, the common case).
+    """
+    if _is_hidden(table):
+        return None
+    styled = _STYLED(table)
+    if not any(el.tag == "style" or _is_hidden(el) for el in styled):
+        return table
+    table = copy.deepcopy(table)
+    for el in _STYLED(table):
+        if el.tag == "style" or _is_hidden(el):
+            el.drop_tree()
+    return table
+
+
+def _text_with_breaks(el: HtmlElement) -> Iterator[str]:
+    """itertext() with a newline for every <br>, as read_html inserts them."""
+    if el.text and isinstance(el.tag, str):
+        yield el.text
+    for child in el:
+        if child.tag == "br":
+            yield "\n"
+        else:
+            yield from _text_with_breaks(child)
+        if child.tail:
+            yield child.tail
+
+
+def _cell_text(cell: HtmlElement) -> str:
+    """Cell text normalized the way pandas.read_html does it."""
+    if cell.find(".//br") is None:
+        text = "".join(cell.itertext())
+    else:
+        text = "".join(_text_with_breaks(cell))
+    return _CELL_WS_RE.sub(" ", text).strip()
+
+
+def _expand_spans(rows: List[HtmlElement], remainder: list, overflow: bool) -> Tuple[List[List[str]], list]:
+    """
+    Text rows with colspan/rowspan cells repeated into every slot they cover
+    (read_html's _expand_colspan_rowspan). `remainder` carries the rowspans
+    still open from the previous section; with overflow=False, rows that
+    exist only because of them are appended.
+    """
+    texts_rows: List[List[str]] = []
+    for tr in rows:
+        texts: List[str] = []
+        next_remainder = []
+        index = 0
+        for cell in _ROW_CELLS(tr):
+            while remainder and remainder[0][0] <= index:
+                prev_i, prev_text, prev_span = remainder.pop(0)
+                texts.append(prev_text)
+                if prev_span > 1:
+                    next_remainder.append((prev_i, prev_text, prev_span - 1))
+                index += 1
+            text = _cell_text(cell)
+            rowspan = int(cell.get("rowspan") or 1)
+            colspan = int(cell.get("colspan") or 1)
+            for _ in range(colspan):
+                texts.append(text)
+                if rowspan > 1:
+                    next_remainder.append((index, text, rowspan - 1))
+                index += 1
+        for prev_i, prev_text, prev_span in remainder:
+            texts.append(prev_text)
+            if prev_span > 1:
+                next_remainder.append((prev_i, prev_text, prev_span - 1))
+        texts_rows.append(texts)
+        remainder = next_remainder
+
+    if not overflow:
+        while remainder:
+            texts_rows.append([text for _, text, _ in remainder])
+            remainder = [(i, text, span - 1) for i, text, span in remainder if span > 1]
+    return texts_rows, remainder
+
+
+def _table_sections(table: HtmlElement) -> Tuple[List[List[str]], List[List[str]]]:
+    """
+    (header rows, data rows) of a table as text: <thead> rows, else the
+    leading rows made only of <th> cells, are the header; <tbody>/<tfoot>
+    rows follow as data.
+    """
+    header_trs: List[HtmlElement] = []
+    for thead in _THEADS(table):
+        header_trs.extend(thead.iterchildren("tr"))
+        if _ROW_CELLS(thead):  # <thead><th>..</th></thead> without a <tr>
+            header_trs.append(thead)
+    body_trs = _TBODY_ROWS(table) + _ROOT_ROWS(table)
+    footer_trs = _TFOOT_ROWS(table)
+    if not header_trs:
+        while body_trs and all(cell.tag == "th" for cell in _ROW_CELLS(body_trs[0])):
+            header_trs.append(body_trs.pop(0))
+
+    header, remainder = _expand_spans(header_trs, [], overflow=True)
+    body, remainder = _expand_spans(body_trs, remainder, overflow=bool(footer_trs))
+    footer, _ = _expand_spans(footer_trs, remainder, overflow=False)
+    return header, body + footer
+
+
+def _table_columns(header_cells: List[str]) -> List[str]:
+    """
+    Name blank headers 'Unnamed: i' and suffix duplicates '.1', '.2' the way
+    pandas' python parser does: named columns first, skipping suffixes that
+    another header already uses.
+    """
+    columns = [name or f"Unnamed: {i}" for i, name in enumerate(header_cells)]
+    unnamed = [i for i, name in enumerate(header_cells) if not name]
+    counts: Dict[str, int] = {}
+    for i in [i for i in range(len(columns)) if header_cells[i]] + unnamed:
+        name = base = columns[i]
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in columns else counts.get(name, 0)
+        columns[i] = name
+        counts[name] = count + 1
+    return columns
+
+
+def _typed_column(col: List[Optional[str]]) -> List[Any]:
+    """read_html's dtype inference for one column; None marks a blank (NaN)."""
+    filled = [v for v in col if v is not None]
+    if len(filled) == len(col) and all(_INT_RE.fullmatch(v) for v in filled):
+        return [int(v) for v in col]
+    if all(_FLOAT_RE.fullmatch(v) for v in filled):
+        return [None if v is None else float(v) for v in col]
+    if all(v in _BOOL_TEXTS for v in filled):
+        return [None if v is None else _BOOL_TEXTS[v] for v in col]
+    return col
+
+
+def _heading_table_rows(heading: HtmlElement) -> List[Dict[str, Any]]:
+    """
+    Rows of the first table after `heading`, read straight from the parsed
+    tree with the same result pd.read_html gave the old extractor:
+
+    - the header comes from <thead> (else the leading all-<th> rows; with
+      several header rows the last non-blank one names the columns); without
+      one, columns are numbered 0..n-1. Blank names become 'Unnamed: i' and
+      duplicates get '.1', '.2' suffixes. The first column is renamed 'Item'.
+    - colspan/rowspan cells are repeated into every slot they cover, <br>
+      reads as a space, and hidden (display:none) elements are skipped.
+    - blank cells and pandas' default NA strings ("NA", "N/A", "nan", ...)
+      are None, and rows whose value cells are all None are dropped.
+    - commas are removed from number-shaped cells, then a column whose filled
+      cells all parse becomes int (no blanks), float (exponents and inf
+      included) or bool; any other column keeps its text.
+    - Item is the string of its typed value ("nan" for a blank), as the old
+      astype(str) produced.
+
+    The one difference: blanks are None rather than float NaN.
+    """
+    # The first <table> after the heading's start tag, inside it or following it
+    tables = _TABLE_AFTER(heading)
+    if not tables:
+        return []
+    table = _displayed_table(tables[0])
+    if table is None:
+        return []
+
+    try:
+        header, data = _table_sections(table)
+    except ValueError:  # a non-numeric colspan/rowspan; read_html fails on it too
+        return []
+    width = max((len(r) for r in header + data), default=0)
+    if width == 0:
+        return []
+    for r in header + data:
+        r += [""] * (width - len(r))
+
+    if header:
+        named = [r for r in header if any(r)] if len(header) > 1 else header
+        data = [named[-1] if named else header[-1]] + data
+    if width == 1:
+        # pandas skips blank lines, a blank header line included
+        data = [texts for texts in data if texts[0]]
+    if header:
+        if not data:
+            return []
+        columns: List[Any] = _table_columns(data.pop(0))
+    else:
+        columns = list(range(width))
+    columns[0] = "Item"
+
+    # Column-major cells; None marks a blank
+    values: List[List[Optional[str]]] = [[] for _ in range(width)]
+    for texts in data:
+        for col, text in zip(values, texts):
+            if text in _NA_TEXTS:
+                col.append(None)
+            elif "," in text and _THOUSANDS_RE.fullmatch(text):
+                col.append(text.replace(",", ""))
+            else:
+                col.append(text)
+
+    # Columns are typed over every row, before blank rows are dropped
+    typed = [_typed_column(col) for col in values]
+    typed[0] = ["nan" if v is None else str(v) for v in typed[0]]
+    return [
+        dict(zip(columns, row))
+        for row in zip(*typed)
+        # Drop rows that are fully blank except Item
+        if width == 1 or any(value is not None for value in row[1:])
+    ]
 
 
-def extract_table(soup: BeautifulSoup, header_text: str) -> List[Dict[str, Any]]:
+def extract_table(tree: HtmlElement, header_text: str) -> List[Dict[str, Any]]:
     """
     Extract table as JSON-friendly list-of-dicts (wide format).
 
@@ -104,46 +384,72 @@ def extract_table(soup: BeautifulSoup, header_text: str) -> List[Dict[str, Any]]
         ...
     ]
 
-    If table not found, returns [].
+    If table not found, returns []. Use extract_all_tables for several
+    sections of one page.
     """
-    df = _extract_table_df(soup, header_text)
-    if df is None or df.empty:
-        return []
-    return df.to_dict(orient="records")
+    return extract_all_tables(tree, [header_text])[header_text]
 
 
-def extract_pros_cons(soup: BeautifulSoup) -> Dict[str, List[str]]:
+def extract_all_tables(
+    tree: HtmlElement,
+    header_texts: Iterable[str],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Tables for several sections in one pass over the page headings:
+    {header_text: rows}, [] for a section that isn't on the page. Each
+    header_text gets the table after the first h2/h3/h4 containing it
+    (case-insensitive).
+    """
+    pending = {text: text.lower() for text in header_texts}
+    result: Dict[str, List[Dict[str, Any]]] = {text: [] for text in pending}
+    for heading in tree.iter("h2", "h3", "h4"):
+        if not pending:
+            break
+        text = _text(heading).lower()
+        for wanted, needle in list(pending.items()):
+            if needle in text:
+                result[wanted] = _heading_table_rows(heading)
+                del pending[wanted]
+    return result
+
+
+def extract_pros_cons(tree: HtmlElement) -> Dict[str, List[str]]:
     """
     Extract pros and cons (strengths and weaknesses) from the analysis section.
     """
     pros: List[str] = []
     cons: List[str] = []
 
-    section = soup.find(id="analysis")
-    if section:
-        strengths = section.find("div", class_="pros")
-        if strengths:
-            pros = [li.get_text(strip=True) for li in strengths.find_all("li")]
+    section = tree.get_element_by_id("analysis", None)
+    if section is not None:
+        strengths = _find_by_class(section, "div", "pros")
+        if strengths is not None:
+            pros = [_text(li) for li in strengths.iterdescendants("li")]
 
-        weaknesses = section.find("div", class_="cons")
-        if weaknesses:
-            cons = [li.get_text(strip=True) for li in weaknesses.find_all("li")]
+        weaknesses = _find_by_class(section, "div", "cons")
+        if weaknesses is not None:
+            cons = [_text(li) for li in weaknesses.iterdescendants("li")]
 
     return {"pros": pros, "cons": cons}
 
 
-def extract_about(soup: BeautifulSoup) -> str:
+def extract_about(tree: HtmlElement) -> str:
     """Extract the company profile text."""
-    profile = soup.find("div", class_="company-profile")
-    return profile.get_text(" ", strip=True) if profile else ""
+    profile = _find_by_class(tree, "div", "company-profile")
+    return _text(profile, " ") if profile is not None else ""
 
 
 def extract_company_and_warehouse(
-    soup: BeautifulSoup,
+    tree: HtmlElement,
 ) -> Tuple[Optional[str], Optional[str]]:
-    company_div = soup.find("div", attrs={"data-company-id": True})
-    warehouse_div = soup.find("div", attrs={"data-warehouse-id": True})
-
-    company_id = company_div.get("data-company-id") if company_div else None
-    warehouse_id = warehouse_div.get("data-warehouse-id") if warehouse_div else None
+    # Screener puts both ids on one div; a single scan finds it
+    both = _IDS_DIV(tree)
+    if both:
+        company_div = warehouse_div = both[0]
+    else:
+        company_div = next(iter(_COMPANY_ID_DIV(tree)), None)
+        warehouse_div = next(iter(_WAREHOUSE_ID_DIV(tree)), None)
+
+    company_id = company_div.get("data-company-id") if company_div is not None else None
+    warehouse_id = warehouse_div.get("data-warehouse-id") if warehouse_div is not None else None
     return company_id, warehouse_id
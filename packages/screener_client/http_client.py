@@ -0,0 +1,83 @@
+# screener_client/http_client.py
+"""
+Shared httpx.AsyncClient for the Screener fetchers.
+
+new_client() builds the pooled client an orchestrator opens once per run and
+passes down, so TCP/TLS connections to screener.in stay alive across
+requests and companies instead of handshaking on every call.
+HTTP/2 is used when the optional `h2` package is installed
+(`pip install httpx[http2]`); otherwise it falls back to HTTP/1.1 keep-alive.
+httpx advertises every Accept-Encoding it can decode: gzip/deflate always,
+br and zstd with the brotli / zstandard extras.
+"""
+import asyncio
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+
+from .config import HEADERS, REQUEST_TIMEOUT
+from .ratelimit import AdmissionController
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - HTTP/1.1 keep-alive fallback
+    h2 = None
+
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+# httpx drops idle connections after 5s by default, shorter than the gaps
+# between companies; keep them (and their DNS/TLS setup) for a minute
+KEEPALIVE_EXPIRY = 60.0
+# Re-dial once when a TCP/TLS connect fails (HTTP errors are not retried here)
+CONNECT_RETRIES = 1
+# In-flight requests per host and event loop, across pages and API calls of
+# all companies; 429s shrink it (down to 1) until a run of successes lets it
+# grow back. A scrape_csv run is one loop; each web refresh runs its own loop
+# in its own thread, and the process-wide pacing comes from the shared token
+# bucket (ratelimit.SCREENER_LIMITER).
+HOST_CONCURRENCY = 8
+
+# host -> controller for the event loop running in this thread. asyncio
+# primitives are bound to one loop and web refreshes run loops concurrently
+# in separate threads, so nothing is shared across threads; a thread only
+# ever runs one loop at a time, and the controllers go away with it.
+_host_admission = threading.local()
+
+
+def new_client() -> httpx.AsyncClient:
+    """
+    Build a client with the Screener headers, timeout and pool limits as
+    defaults. Whoever owns a run opens it with `async with new_client()` and
+    passes it down, so it is always closed with the run.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=h2 is not None,
+        retries=CONNECT_RETRIES,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        headers=HEADERS,
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,  # company pages redirect, e.g. to /consolidated/
+    )
+
+
+def host_admission(url: str) -> AdmissionController:
+    """Per-host admission controller (up to HOST_CONCURRENCY slots) for the running event loop."""
+    loop = asyncio.get_running_loop()
+    host = urlsplit(url).hostname or ""
+    if getattr(_host_admission, "loop", None) is not loop:
+        _host_admission.loop = loop
+        _host_admission.controllers = {}
+    controllers = _host_admission.controllers
+    admission = controllers.get(host)
+    if admission is None:
+        admission = controllers[host] = AdmissionController(HOST_CONCURRENCY)
+    return admission
+
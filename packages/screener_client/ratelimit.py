@@ -0,0 +1,147 @@
+# screener_client/ratelimit.py
+"""
+Flow control shared by every Screener request.
+
+TokenBucket paces requests: tokens refill continuously at `rate_per_sec` up
+to `capacity` (the burst). acquire() takes a token, reserving one ahead of
+time when the bucket is empty and sleeping until it is due, so concurrent
+callers are paced in arrival order without a lock (and the bucket works
+across asyncio.run() calls). record() halves the rate on a 429 (holding
+new requests for its Retry-After) and creeps back up after successes.
+
+AdmissionController caps requests in flight, with a limit that can be
+lowered or raised mid-run (record() shrinks it on 429s and grows it back
+after a streak of successes).
+"""
+import asyncio
+import time
+from typing import Optional
+
+from .config import REQUEST_BURST, REQUESTS_PER_SECOND
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a numeric Retry-After header value (HTTP dates are ignored)."""
+    if value and value.replace(".", "", 1).isdigit():
+        return float(value)
+    return None
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate_per_sec: float,
+        capacity: int,
+        *,
+        min_rate: Optional[float] = None,
+        recover_after: int = 20,
+    ):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.max_rate = rate_per_sec
+        self.min_rate = min_rate if min_rate is not None else rate_per_sec / 8
+        self.recover_after = recover_after
+        self._successes = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate_per_sec)
+        self.last_refill = now
+
+    async def acquire(self) -> None:
+        self._refill()
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate_per_sec)
+
+    def record(self, status_code: int, retry_after: Optional[float] = None) -> None:
+        """
+        Adapt the rate to a response: a 429 halves it (down to min_rate) and
+        holds requests not yet admitted for `retry_after` seconds; every
+        `recover_after` successes raise it by a quarter, back up to max_rate.
+        """
+        if status_code == 429:
+            self._refill()
+            self._successes = 0
+            rate = max(self.min_rate, self.rate_per_sec / 2)
+            if rate < self.rate_per_sec:
+                self.rate_per_sec = rate
+                print(f"Warning: got 429, pacing requests at {rate:.2f}/s")
+            if retry_after:
+                # The next acquire() lands exactly `retry_after` from now
+                self.tokens = min(self.tokens, 1 - retry_after * self.rate_per_sec)
+        elif status_code < 400 and self.rate_per_sec < self.max_rate:
+            self._successes += 1
+            if self._successes >= self.recover_after:
+                self._refill()
+                self._successes = 0
+                self.rate_per_sec = min(self.max_rate, self.rate_per_sec * 1.25)
+
+
+class AdmissionController:
+    """
+    Counting semaphore with a resizable limit: an explicit active count
+    guarded by an asyncio.Condition. Bound to the event loop it is first
+    used on, like asyncio.Semaphore.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        min_limit: int = 1,
+        max_limit: Optional[int] = None,
+        grow_after: int = 20,
+    ):
+        self.limit = limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit if max_limit is not None else limit
+        self.grow_after = grow_after
+        self.active = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self.active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> int:
+        """Clamp `limit` to [min_limit, max_limit], apply it and return it."""
+        limit = max(self.min_limit, min(self.max_limit, limit))
+        async with self._cond:
+            if limit > self.limit:
+                self._cond.notify_all()
+            self.limit = limit
+        return limit
+
+    async def record(self, status_code: int) -> None:
+        """Shrink the limit by one on a 429; grow it by one after `grow_after` successes."""
+        if status_code == 429:
+            self._successes = 0
+            if self.limit > self.min_limit:
+                limit = await self.set_limit(self.limit - 1)
+                print(f"Warning: got 429, lowering in-flight requests to {limit}")
+        elif status_code < 400:
+            self._successes += 1
+            if self._successes >= self.grow_after and self.limit < self.max_limit:
+                self._successes = 0
+                await self.set_limit(self.limit + 1)
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.release()
+
+
+# The one bucket every Screener request (pages and API) draws from
+SCREENER_LIMITER = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
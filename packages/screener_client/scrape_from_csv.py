@@ -1,4 +1,5 @@
 import asyncio
+import csv
 import sys
 from pathlib import Path
 
@@ -9,42 +10,42 @@ else:
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-import pandas as pd
-from typing import List
+import httpx
+from typing import Iterator
 
-from packages.shared_db.db_utils import upsert_company, store_raw_json
+from packages.shared_db.db_utils import flush_failed_companies
+from packages.shared_db.writer import BackgroundWriter
+from packages.screener_client.cache import get_cache_mode, prune_cache, set_cache_mode
 from packages.screener_client.company_retry import scrape_company_with_retries
+from packages.screener_client.http_client import new_client
 
 
-CONCURRENCY = 1
-_sem = asyncio.Semaphore(CONCURRENCY)
+# Worker tasks, i.e. companies in flight; request pacing comes from the
+# shared token bucket and per-host cap (ratelimit.py / http_client.py)
+CONCURRENCY = 8
 
 
-async def scrape_one(symbol: str, url: str) -> None:
-    async with _sem:
-        print(f"Scraping {symbol} -> {url}")
-        data = await scrape_company_with_retries(url)
-        if not data:
-            print(f"Skipping {symbol} (no data after retries)")
-            return
+async def scrape_one(symbol: str, url: str, writer: BackgroundWriter, client: httpx.AsyncClient) -> None:
+    print(f"Scraping {symbol} -> {url}")
+    data = await scrape_company_with_retries(url, client=client)
+    if not data:
+        print(f"Skipping {symbol} (no data after retries)")
+        return
 
-        meta = data.get("meta", {}) or {}
-        upsert_company(
-            meta.get("company_id"),
-            meta.get("warehouse_id"),
-            meta.get("company_name"),
-            url,
-        )
-        store_raw_json(meta.get("company_id"), url, data)
-        print(f"Stored data for {symbol} ({url})")
+    meta = data.get("meta", {}) or {}
+    writer.upsert_company(
+        meta.get("company_id"),
+        meta.get("warehouse_id"),
+        meta.get("company_name"),
+        url,
+    )
+    writer.store_raw_json(meta.get("company_id"), url, data)
+    print(f"Queued data for {symbol} ({url})")
 
-        # be extra nice to Screener
-        await asyncio.sleep(2.0)
 
-
-def _build_urls_from_csv(csv_path: str) -> List[tuple[str, str]]:
+def _iter_urls_from_csv(csv_path: str) -> Iterator[tuple[str, str]]:
     """
-    Read the CSV and return a list of (symbol, url) tuples.
+    Yield (symbol, url) tuples from the CSV, one row at a time.
 
     CSV is expected to have at least:
         - 'symbol'
@@ -53,44 +54,74 @@ def _build_urls_from_csv(csv_path: str) -> List[tuple[str, str]]:
         - 'isin number'
         - 'market cap'
     """
-    df = pd.read_csv(csv_path)
-
-    if "symbol" not in df.columns:
-        raise ValueError("CSV must contain a 'symbol' column.")
-
-    # Normalize symbol
-    df["symbol"] = df["symbol"].astype(str).str.strip().str.upper()
-
     base = "https://www.screener.in/company"
-    symbol_url_pairs: List[tuple[str, str]] = []
 
-    for _, row in df.iterrows():
-        symbol = row["symbol"]
-        if not symbol:
-            continue
-        url = f"{base}/{symbol}/consolidated/"
-        symbol_url_pairs.append((symbol, url))
+    # utf-8-sig: exports from Excel start with a BOM before 'symbol'
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        if "symbol" not in (reader.fieldnames or ()):
+            raise ValueError("CSV must contain a 'symbol' column.")
 
-    return symbol_url_pairs
+        for row in reader:
+            # Normalize symbol
+            symbol = (row["symbol"] or "").strip().upper()
+            if symbol:
+                yield symbol, f"{base}/{symbol}/consolidated/"
 
 
 async def scrape_csv(csv_path: str) -> None:
     """
     Orchestrate scraping for all companies listed in a CSV file.
 
-    Uses the 'symbol' column to construct Screener URLs.
+    Uses the 'symbol' column to construct Screener URLs. They are streamed
+    from the CSV into a bounded queue drained by CONCURRENCY workers, so only
+    a handful of companies exist as tasks at any time, however long the CSV.
     """
-    symbol_url_pairs = _build_urls_from_csv(csv_path)
-    print(f"Found {len(symbol_url_pairs)} symbols in CSV")
-
-    tasks = [scrape_one(symbol, url) for symbol, url in symbol_url_pairs]
-    await asyncio.gather(*tasks)
+    if get_cache_mode() == "use":
+        # Replay runs keep every entry, whatever its age
+        pruned = prune_cache()
+        if pruned:
+            print(f"Pruned {pruned} expired cache entries")
+
+    queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=CONCURRENCY * 4)
+
+    async def worker(writer: BackgroundWriter, client: httpx.AsyncClient) -> None:
+        while True:
+            symbol, url = await queue.get()
+            try:
+                await scrape_one(symbol, url, writer, client)
+            except Exception as e:
+                print(f"Error scraping {symbol} ({url}): {e}")
+            finally:
+                queue.task_done()
+
+    async with new_client() as client:
+        with BackgroundWriter() as writer:
+            workers = [asyncio.create_task(worker(writer, client)) for _ in range(CONCURRENCY)]
+            try:
+                count = 0
+                for pair in _iter_urls_from_csv(csv_path):
+                    await queue.put(pair)
+                    count += 1
+                print(f"Found {count} symbols in CSV")
+                await queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                # Companies that failed every retry, still below the batch size
+                flush_failed_companies()
 
 if __name__ == "__main__":
     import sys
 
-    if len(sys.argv) < 2:
-        raise SystemExit("Usage: python scrape_from_csv.py <path_to_csv>")
+    args = sys.argv[1:]
+    if "--no-cache" in args:
+        args.remove("--no-cache")
+        set_cache_mode("off")  # always hit Screener, don't touch the on-disk cache
+
+    if len(args) < 1:
+        raise SystemExit("Usage: python scrape_from_csv.py <path_to_csv> [--no-cache]")
 
-    csv_path = sys.argv[1]
+    csv_path = args[0]
     asyncio.run(scrape_csv(csv_path))
@@ -0,0 +1,46 @@
+# db/bulk_load.py
+"""
+One-shot rebuild of the fundamentals table from a CSV export, bypassing the
+row-oriented db_utils helpers: DuckDB parses the file natively with
+read_csv (the path is bound as a parameter, never spliced into the SQL).
+Keep db_utils for incremental scrape writes.
+
+    python -m packages.shared_db.bulk_load fundamentals path/to/fundamental_data.csv
+"""
+import sys
+from pathlib import Path
+
+if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+    _ROOT_DIR = Path(sys._MEIPASS)
+else:
+    _ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(_ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(_ROOT_DIR))
+
+from packages.shared_db.db_utils import get_fundamentals_connection  # noqa: E402
+from packages.shared_db.export_parquet import FUNDAMENTALS_PARQUET, export_table  # noqa: E402
+
+
+def load_fundamentals_from_csv(csv_path) -> int:
+    """
+    Rebuild the fundamentals table from a fundamental_data_all_stocks*.csv
+    export and refresh its Parquet snapshot. Returns row count.
+    """
+    con = get_fundamentals_connection()
+    try:
+        con.execute(
+            "CREATE OR REPLACE TABLE fundamentals AS SELECT * FROM read_csv(?, header = true)",
+            [Path(csv_path).as_posix()],
+        )
+        export_table(con, "fundamentals", FUNDAMENTALS_PARQUET)
+        return con.execute("SELECT COUNT(*) FROM fundamentals").fetchone()[0]
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "fundamentals":
+        print("Usage: python -m packages.shared_db.bulk_load fundamentals <csv_path>")
+        sys.exit(1)
+
+    print(f"✅ Loaded {load_fundamentals_from_csv(sys.argv[2])} rows into fundamentals")
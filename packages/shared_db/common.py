@@ -1,7 +1,12 @@
 # db/common.py
+import re
 import pandas as pd
 import numpy as np
 from datetime import date
+from functools import lru_cache
+
+_STRIP = re.compile(r"₹|Rs\.?|Cr\.|cr\.?|[,%\s]")
+_UNICODE_MINUS = "\u2212"  # '−' as rendered on Screener pages
 
 
 def clean_numeric(x):
@@ -9,30 +14,29 @@ def clean_numeric(x):
     Convert Screener-style values to float (handles %, commas, ₹, Cr., etc.).
     Returns None when it can't parse.
     """
-    if x is None or (isinstance(x, float) and np.isnan(x)):
+    if x is None:
         return None
     if isinstance(x, (int, float)):
-        return float(x)
+        return None if x != x else float(x)
 
     s = str(x).strip()
     if s in ("", "-", "NaN", "nan", "None"):
         return None
 
     # Remove common symbols
-    for tok in ["₹", "Rs.", "Rs", "Cr.", "cr.", "cr", "%", ","]:
-        s = s.replace(tok, "")
-
-    s = s.strip()
+    s = _STRIP.sub("", s).replace(_UNICODE_MINUS, "-")
     try:
         return float(s)
     except ValueError:
         return None
 
 
+@lru_cache(maxsize=4096)
 def parse_period_label_to_date(label: str) -> date:
     """
     Convert labels like 'Sep 2022' or 'Mar 2014' into a DATE.
     We'll map them to the first day of that month.
+    Cached: the same few dozen labels recur across every company.
     """
     # Use errors='coerce' so bad labels become NaT
     return pd.to_datetime(label + " 01", format="%b %Y %d", errors="coerce").date()
@@ -40,6 +44,8 @@ def parse_period_label_to_date(label: str) -> date:
 
 def ensure_date(col):
     """
-    Convert a Series to Python date objects (assuming it's str/datetime-like).
+    Convert a Series (str/datetime-like) to a datetime64 Series truncated to
+    the day, keeping its index. Unparseable values become NaT. DuckDB reads
+    datetime64 columns natively, without boxing a Python date object per row.
     """
-    return pd.to_datetime(col).dt.date
+    return pd.to_datetime(col, errors="coerce", cache=True).dt.normalize()
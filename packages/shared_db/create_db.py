@@ -14,8 +14,16 @@ def run_schema():
         schema_sql = f.read()
 
     con = duckdb.connect(DB_FILE)
-    con.execute(schema_sql)
-    con.close()
+    try:
+        # One transaction for the whole script: a single catalog commit
+        con.begin()
+        con.execute(schema_sql)
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        con.close()
 
     print("✅ Database schema created successfully!")
 
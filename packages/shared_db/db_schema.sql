@@ -35,3 +35,6 @@ CREATE TABLE IF NOT EXISTS announcements (
     sentiment VARCHAR,
     fetched_at TIMESTAMP
 );
+
+-- Announcement lookups filter by symbol
+CREATE INDEX IF NOT EXISTS idx_announcements_symbol ON announcements(symbol);
@@ -1,13 +1,27 @@
 # db/db_utils.py
 
+import atexit
+import itertools
 import json
 import sys
+import threading
+from collections import deque
 from datetime import datetime
 import duckdb
 from typing import Optional
 from pathlib import Path
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - pandas staging fallback
+    pa = None
+
 # Ensure project root is on sys.path so paths module can be imported
 if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
     _ROOT_DIR = Path(sys._MEIPASS)
@@ -17,33 +31,127 @@ if str(_ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(_ROOT_DIR))
 
 from config.paths import SCREENER_DB, ANNOUNCEMENTS_DB, FUNDAMENTALS_DB  # noqa: E402
+from packages.shared_db.export_parquet import (  # noqa: E402
+    FUNDAMENTALS_PARQUET,
+    export_table,
+    parquet_source,
+)
 
 DB_FILE = str(SCREENER_DB)
 
+def run_ddl(con, ddl: str) -> None:
+    """Apply a multi-statement DDL script as one transaction (one catalog commit)."""
+    con.begin()
+    try:
+        con.execute(ddl)
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+
+
+_CON: Optional[duckdb.DuckDBPyConnection] = None
+_CON_LOCK = threading.Lock()
+_thread_local = threading.local()
+
+
 def get_connection():
-    con = duckdb.connect(DB_FILE)
-    # Initialize screener tables if they don't exist
-    con.execute("""
-        CREATE TABLE IF NOT EXISTS companies (
-            company_id VARCHAR PRIMARY KEY,
-            warehouse_id VARCHAR,
-            company_name VARCHAR,
-            source_url VARCHAR
-        );
-        CREATE TABLE IF NOT EXISTS raw_company_json (
-            company_id VARCHAR,
-            source_url VARCHAR,
-            scraped_at TIMESTAMP,
-            payload_json JSON
-        );
-        CREATE TABLE IF NOT EXISTS failed_companies (
-            company_id VARCHAR,
-            source_url VARCHAR,
-            failure_reason VARCHAR,
-            last_attempt TIMESTAMP
-        );
-    """)
-    return con
+    """
+    Return the calling thread's cursor on the shared screener DB connection.
+
+    The connection is opened (and the screener tables created) on first use
+    and kept open for the life of the process; callers must not close it.
+    Use close_connection() to release the database file explicitly.
+    """
+    global _CON
+    with _CON_LOCK:
+        if _CON is None:
+            _CON = duckdb.connect(DB_FILE)
+            # Bulk-ingest tuning: appends don't need to keep insertion order
+            # (every read orders explicitly). threads already defaults to
+            # the core count.
+            _CON.execute("SET preserve_insertion_order = false")
+            # Initialize screener tables if they don't exist
+            run_ddl(_CON, """
+                CREATE TABLE IF NOT EXISTS companies (
+                    company_id VARCHAR PRIMARY KEY,
+                    warehouse_id VARCHAR,
+                    company_name VARCHAR,
+                    source_url VARCHAR
+                );
+                CREATE TABLE IF NOT EXISTS raw_company_json (
+                    company_id VARCHAR,
+                    source_url VARCHAR,
+                    scraped_at TIMESTAMP,
+                    payload_json JSON
+                );
+                CREATE TABLE IF NOT EXISTS failed_companies (
+                    company_id VARCHAR,
+                    source_url VARCHAR,
+                    failure_reason VARCHAR,
+                    last_attempt TIMESTAMP
+                );
+            """)
+        root = _CON
+
+    # DuckDB connections are not thread-safe; hand each thread its own cursor.
+    if getattr(_thread_local, "root", None) is not root:
+        _thread_local.cursor = root.cursor()
+        _thread_local.root = root
+    return _thread_local.cursor
+
+
+def close_connection() -> None:
+    """
+    Close the shared screener DB connection (and every thread's cursor),
+    writing any queued failed_companies rows first.
+    """
+    global _CON
+    flush_failed_companies()
+    with _CON_LOCK:
+        if _CON is not None:
+            _CON.close()
+            _CON = None
+        _thread_local.root = None
+        _thread_local.cursor = None
+
+
+atexit.register(close_connection)
+
+
+def _json_default(value):
+    """orjson fallback for objects it can't serialize natively."""
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict(orient="records")
+    if isinstance(value, pd.Series):
+        return value.tolist()
+    if hasattr(value, "isoformat"):  # pd.Timestamp, datetime.time, ...
+        return value.isoformat()
+    raise TypeError
+
+
+def dumps_payload(payload) -> str:
+    """
+    Serialize a scrape payload for the payload_json column. Uses orjson when
+    available (NaN becomes null, numpy scalars and non-str keys are handled,
+    DataFrames/timestamps via _json_default) and falls back to json.dumps
+    for anything orjson rejects. Bytes are taken as already-serialized JSON
+    (e.g. a cached API body) and only decoded.
+    """
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return bytes(payload).decode()
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False)
 
 
 def store_raw_json(company_id, url, payload):
@@ -52,37 +160,60 @@ def store_raw_json(company_id, url, payload):
     con.execute(
         """
         INSERT INTO raw_company_json (company_id, source_url, scraped_at, payload_json)
-        VALUES (?, ?, ?, ?)
+        VALUES (?, ?, timezone('UTC', current_timestamp), ?)
         """,
         [
             company_id,
             url,
-            datetime.utcnow(),
-            json.dumps(payload, ensure_ascii=False),
+            dumps_payload(payload),
         ],
     )
-    con.close()
 
 
-def upsert_company(company_id, warehouse_id, name, url):
-    if company_id is None:
+UPSERT_COMPANY_SQL = """
+    INSERT INTO companies (company_id, warehouse_id, company_name, source_url)
+    VALUES {values}
+    ON CONFLICT(company_id) DO UPDATE SET
+        warehouse_id = EXCLUDED.warehouse_id,
+        company_name = EXCLUDED.company_name,
+        source_url = EXCLUDED.source_url
+"""
+UPSERT_COMPANY_CHUNK = 1000
+
+
+def upsert_companies(rows, con=None) -> None:
+    """
+    Upsert (company_id, warehouse_id, company_name, source_url) tuples with
+    one multi-row INSERT per UPSERT_COMPANY_CHUNK rows (executemany runs the
+    upsert once per row, ~100x slower in DuckDB). Rows without a company_id
+    are skipped; for a repeated company_id the last row wins, as it did with
+    row-by-row upserts. When `con` is given it is used instead of the shared
+    connection.
+    """
+    latest = {}
+    for row in rows:
+        if row[0] is not None:
+            latest.pop(row[0], None)
+            latest[row[0]] = row
+    if not latest:
         return
 
-    con = get_connection()
-    con.execute(
-        """
-        INSERT INTO companies (company_id, warehouse_id, company_name, source_url)
-        VALUES (?, ?, ?, ?)
-        ON CONFLICT(company_id) DO UPDATE SET
-            warehouse_id = EXCLUDED.warehouse_id,
-            company_name = EXCLUDED.company_name,
-            source_url = EXCLUDED.source_url
-        """,
-        [company_id, warehouse_id, name, url],
-    )
-    con.close()
+    con = con if con is not None else get_connection()
+    unique = list(latest.values())
+    for start in range(0, len(unique), UPSERT_COMPANY_CHUNK):
+        chunk = unique[start:start + UPSERT_COMPANY_CHUNK]
+        sql = UPSERT_COMPANY_SQL.format(values=", ".join(["(?, ?, ?, ?)"] * len(chunk)))
+        con.execute(sql, [value for row in chunk for value in row])
+
+
+def upsert_company(company_id, warehouse_id, name, url):
+    upsert_companies([(company_id, warehouse_id, name, url)])
 
 
+FAILED_FLUSH_SIZE = 500
+_failed_buffer: deque = deque()
+_failed_lock = threading.Lock()
+
 
 def mark_failed_company(
     company_id: Optional[str],
@@ -90,29 +221,232 @@ def mark_failed_company(
     failure_reason: str,
 ) -> None:
     """
-    Insert a row into failed_companies.
+    Queue a row for failed_companies; rows are written in batches of
+    FAILED_FLUSH_SIZE, and callers flush the rest with
+    flush_failed_companies() (close_connection() does too) when a run ends.
     company_id can be None if we never reached the point of extracting it.
     """
-    con = get_connection()
-    con.execute(
-        """
-        INSERT INTO failed_companies (company_id, source_url, failure_reason, last_attempt)
-        VALUES (?, ?, ?, ?)
-        """,
-        [
-            company_id,
-            source_url,
-            failure_reason,
-            datetime.utcnow(),
-        ],
-    )
-    con.close()
+    _failed_buffer.append((company_id, source_url, failure_reason))
+    if len(_failed_buffer) >= FAILED_FLUSH_SIZE:
+        flush_failed_companies()
+
+
+def flush_failed_companies() -> None:
+    """Write all queued failed_companies rows with one executemany in one transaction."""
+    with _failed_lock:
+        rows = []
+        while _failed_buffer:
+            rows.append(_failed_buffer.popleft())
+        if not rows:
+            return
+        con = get_connection()
+        con.begin()
+        try:
+            con.executemany(
+                """
+                INSERT INTO failed_companies (company_id, source_url, failure_reason, last_attempt)
+                VALUES (?, ?, ?, timezone('UTC', current_timestamp))
+                """,
+                rows,
+            )
+            con.commit()
+        except Exception:
+            con.rollback()
+            raise
+
+
+# Buffered columns; the timestamp column of each table is filled in by the
+# INSERT itself (see _bulk_insert), like store_raw_json does.
+RAW_JSON_COLUMNS = ["company_id", "source_url", "payload_json"]
+FAILED_COMPANY_COLUMNS = ["company_id", "source_url", "failure_reason"]
+
+RAW_JSON_DTYPES = {
+    "company_id": "string",
+    "source_url": "string",
+    "payload_json": "string",
+}
+FAILED_COMPANY_DTYPES = {
+    "company_id": "string",
+    "source_url": "string",
+    "failure_reason": "string",
+}
+
+UTC_NOW_SQL = "timezone('UTC', current_timestamp)"
+
+
+VALUES_CHUNK_ROWS = 1000
+
+
+def _insert_values(
+    con, table: str, rows: list[tuple], columns: list[str], stamp_column: Optional[str] = None
+) -> None:
+    """
+    Insert rows as multi-row `VALUES (?, ...), (?, ...)` statements, one
+    execute() per VALUES_CHUNK_ROWS rows. `stamp_column`, if given, is set
+    to the current UTC time.
+    """
+    col_list = ", ".join(columns + ([stamp_column] if stamp_column else []))
+    row_placeholder = "(" + ", ".join(["?"] * len(columns) + ([UTC_NOW_SQL] if stamp_column else [])) + ")"
+    for start in range(0, len(rows), VALUES_CHUNK_ROWS):
+        chunk = rows[start:start + VALUES_CHUNK_ROWS]
+        placeholders = ", ".join([row_placeholder] * len(chunk))
+        con.execute(
+            f"INSERT INTO {table} ({col_list}) VALUES {placeholders}",
+            list(itertools.chain.from_iterable(chunk)),
+        )
+
+
+_ARROW_TYPES = {"string": "string"}
+
+
+def _staging_table(rows: list[tuple], columns: list[str], dtypes: dict):
+    """
+    Build the columnar staging object for _bulk_insert: a pyarrow Table built
+    straight from the row tuples when pyarrow is installed (DuckDB scans it
+    zero-copy, no pandas object columns), else a typed DataFrame.
+    """
+    if pa is not None:
+        return pa.table(
+            {
+                col: pa.array(values, type=pa.type_for_alias(_ARROW_TYPES[dtypes[col]]))
+                for col, values in zip(columns, zip(*rows))
+            }
+        )
+    return pd.DataFrame(rows, columns=columns).astype(dtypes)
+
+
+def _bulk_insert(
+    con,
+    table: str,
+    rows: list[tuple],
+    columns: list[str],
+    dtypes: dict,
+    stamp_column: Optional[str] = None,
+) -> None:
+    """
+    Insert buffered rows with one columnar INSERT ... SELECT from a
+    registered Arrow table / DataFrame instead of binding parameters row by row.
+    Batches smaller than VALUES_CHUNK_ROWS (e.g. the final flush) use a
+    multi-row VALUES insert, which is cheaper than building a frame.
+    `stamp_column`, if given, is set to the current UTC time.
+    """
+    if len(rows) < VALUES_CHUNK_ROWS:
+        _insert_values(con, table, rows, columns, stamp_column)
+        return
+
+    data = _staging_table(rows, columns, dtypes)
+    view = f"_stg_{table}"
+    col_list = ", ".join(columns)
+    target_cols, select_cols = col_list, col_list
+    if stamp_column:
+        target_cols += f", {stamp_column}"
+        select_cols += f", {UTC_NOW_SQL}"
+    con.register(view, data)
+    try:
+        con.execute(f"INSERT INTO {table} ({target_cols}) SELECT {select_cols} FROM {view}")
+    finally:
+        con.unregister(view)
+
+
+class RawJsonWriter:
+    """
+    Buffer companies / raw_company_json / failed_companies rows on a single
+    connection.
+
+    Rows are kept in memory and written in one transaction (see
+    flush_pending) every `batch_size` rows and when the writer is closed.
+    Companies are upserted with multi-row VALUES; raw JSON and failures go
+    through _bulk_insert: multi-row VALUES below VALUES_CHUNK_ROWS, else an
+    INSERT ... SELECT from a pyarrow Table (a typed DataFrame only when
+    pyarrow is missing):
+
+        with RawJsonWriter() as writer:
+            writer.upsert_company(company_id, warehouse_id, name, url)
+            writer.store_raw_json(company_id, url, payload)
+    """
+
+    def __init__(self, batch_size: int = 10_000):
+        self.batch_size = batch_size
+        self._con = get_connection()
+        self._raw_rows: list[tuple] = []
+        self._company_rows: list[tuple] = []
+        self._failed_rows: list[tuple] = []
+
+    def upsert_company(self, company_id, warehouse_id, name, url) -> None:
+        if company_id is None:
+            return
+        self._company_rows.append((company_id, warehouse_id, name, url))
+        if len(self._company_rows) >= self.batch_size:
+            self.flush_pending()
+
+    def store_raw_json(self, company_id, url, payload) -> None:
+        self._raw_rows.append(
+            (company_id, url, dumps_payload(payload))
+        )
+        if len(self._raw_rows) >= self.batch_size:
+            self.flush_pending()
+
+    def mark_failed_company(
+        self,
+        company_id: Optional[str],
+        source_url: str,
+        failure_reason: str,
+    ) -> None:
+        self._failed_rows.append((company_id, source_url, failure_reason))
+        if len(self._failed_rows) >= self.batch_size:
+            self.flush_pending()
+
+    def flush_pending(self) -> None:
+        """Write every buffered row in one transaction (one commit per flush)."""
+        if not (self._company_rows or self._raw_rows or self._failed_rows):
+            return
+
+        self._con.begin()
+        try:
+            if self._company_rows:
+                upsert_companies(self._company_rows, self._con)
+            if self._raw_rows:
+                _bulk_insert(
+                    self._con,
+                    "raw_company_json",
+                    self._raw_rows,
+                    RAW_JSON_COLUMNS,
+                    RAW_JSON_DTYPES,
+                    stamp_column="scraped_at",
+                )
+            if self._failed_rows:
+                _bulk_insert(
+                    self._con,
+                    "failed_companies",
+                    self._failed_rows,
+                    FAILED_COMPANY_COLUMNS,
+                    FAILED_COMPANY_DTYPES,
+                    stamp_column="last_attempt",
+                )
+            self._con.commit()
+        except Exception:
+            self._con.rollback()
+            raise
+
+        self._company_rows = []
+        self._raw_rows = []
+        self._failed_rows = []
+
+    def close(self) -> None:
+        self.flush_pending()
+
+    def __enter__(self) -> "RawJsonWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
 
 ANNOUNCEMENTS_DB_FILE = str(ANNOUNCEMENTS_DB)
 
 def get_announcements_connection():
     con = duckdb.connect(ANNOUNCEMENTS_DB_FILE)
-    con.execute('''
+    run_ddl(con, '''
     CREATE TABLE IF NOT EXISTS announcements (
         symbol VARCHAR,
         company_name VARCHAR,
@@ -121,7 +455,8 @@ def get_announcements_connection():
         summary VARCHAR,
         sentiment VARCHAR,
         fetched_at TIMESTAMP
-    )
+    );
+    CREATE INDEX IF NOT EXISTS idx_announcements_symbol ON announcements(symbol);
     ''')
     try:
         con.execute("ALTER TABLE announcements ADD COLUMN IF NOT EXISTS title VARCHAR")
@@ -129,30 +464,53 @@ def get_announcements_connection():
         pass
     return con
 
-def store_announcement(symbol: str, company_name: str, broadcast_date: str, pdf_url: str, summary: str, sentiment: str, title: str = ""):
-    con = get_announcements_connection()
-    con.execute(
-        """
-        INSERT INTO announcements (symbol, company_name, broadcast_date, pdf_url, summary, sentiment, fetched_at, title)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(pdf_url) DO UPDATE SET
-            summary = EXCLUDED.summary,
-            sentiment = EXCLUDED.sentiment,
-            title = EXCLUDED.title
-        """,
-        [symbol, company_name, broadcast_date, pdf_url, summary, sentiment, datetime.utcnow(), title]
-    )
-    con.close()
+STORE_ANNOUNCEMENT_SQL = """
+    INSERT INTO announcements (symbol, company_name, broadcast_date, pdf_url, summary, sentiment, title, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, timezone('UTC', current_timestamp))
+    ON CONFLICT(pdf_url) DO UPDATE SET
+        summary = EXCLUDED.summary,
+        sentiment = EXCLUDED.sentiment,
+        title = EXCLUDED.title
+"""
 
-def get_processed_pdf_urls() -> set:
-    con = get_announcements_connection()
+
+def store_announcement(symbol: str, company_name: str, broadcast_date: str, pdf_url: str, summary: str, sentiment: str, title: str = "", con=None):
+    store_announcements([(symbol, company_name, broadcast_date, pdf_url, summary, sentiment, title)], con=con)
+
+def store_announcements(rows, con=None) -> None:
+    """
+    Upsert many announcements in one executemany.
+    Rows are (symbol, company_name, broadcast_date, pdf_url, summary, sentiment, title).
+    When `con` is given it is used (and left open) instead of opening a new connection.
+    """
+    if not rows:
+        return
+    own_con = con is None
+    con = get_announcements_connection() if own_con else con
+    try:
+        # One transaction for the whole batch instead of a commit per row
+        con.begin()
+        try:
+            con.executemany(STORE_ANNOUNCEMENT_SQL, rows)
+            con.commit()
+        except Exception:
+            con.rollback()
+            raise
+    finally:
+        if own_con:
+            con.close()
+
+def get_processed_pdf_urls(con=None) -> set:
+    own_con = con is None
+    con = get_announcements_connection() if own_con else con
     try:
         results = con.execute("SELECT pdf_url FROM announcements").fetchall()
         return {r[0] for r in results}
     except duckdb.CatalogException:
         return set()
     finally:
-        con.close()
+        if own_con:
+            con.close()
 
 def get_announcement_stats(symbol: str = None, start_date: str = None, end_date: str = None):
     con = get_announcements_connection()
@@ -254,18 +612,38 @@ def store_fundamental_data(df: pd.DataFrame):
     con = get_fundamentals_connection()
     try:
         df["fetched_at"] = datetime.utcnow().isoformat()
-        con.execute("CREATE OR REPLACE TABLE fundamentals AS SELECT * FROM df")
+        # Register explicitly rather than relying on DuckDB's frame-variable lookup
+        con.register("fundamentals_in", df)
+        con.execute("CREATE OR REPLACE TABLE fundamentals AS SELECT * FROM fundamentals_in")
+        con.unregister("fundamentals_in")
+        try:
+            export_table(con, "fundamentals", FUNDAMENTALS_PARQUET)
+        except Exception:
+            # Readers prefer the snapshot; drop it rather than serve stale data
+            FUNDAMENTALS_PARQUET.unlink(missing_ok=True)
+            raise
     except Exception as e:
         print(f"Error storing fundamentals DB: {e}")
     finally:
         con.close()
 
+def _fundamentals_reader():
+    """
+    Return (connection, FROM source) for read-only fundamentals queries.
+    Prefers the Parquet snapshot, scanned on an in-memory connection;
+    store_fundamental_data removes it when an export fails, so it is never
+    older than the table.
+    """
+    if FUNDAMENTALS_PARQUET.exists():
+        return duckdb.connect(), parquet_source(FUNDAMENTALS_PARQUET)
+    return duckdb.connect(str(FUNDAMENTALS_DB), read_only=True), "fundamentals"
+
 def get_symbols_with_min_market_cap(min_cap: float = 5000) -> set:
-    if not FUNDAMENTALS_DB.exists():
+    if not FUNDAMENTALS_DB.exists() and not FUNDAMENTALS_PARQUET.exists():
         return set()
     try:
-        con = duckdb.connect(str(FUNDAMENTALS_DB), read_only=True)
-        results = con.execute("SELECT Symbol FROM fundamentals WHERE \"Market Cap\" > ?", [min_cap]).fetchall()
+        con, source = _fundamentals_reader()
+        results = con.execute(f"SELECT Symbol FROM {source} WHERE \"Market Cap\" > ?", [min_cap]).fetchall()
         con.close()
         return {r[0] for r in results}
     except duckdb.CatalogException:
@@ -277,11 +655,11 @@ def get_symbols_with_min_market_cap(min_cap: float = 5000) -> set:
         con.close()
 
 def get_fundamentals_metadata():
-    if not FUNDAMENTALS_DB.exists():
+    if not FUNDAMENTALS_DB.exists() and not FUNDAMENTALS_PARQUET.exists():
         return {"last_refresh": None, "company_count": 0}
     try:
-        con = duckdb.connect(str(FUNDAMENTALS_DB), read_only=True)
-        results = con.execute("SELECT MAX(fetched_at), COUNT(Symbol) FROM fundamentals").fetchone()
+        con, source = _fundamentals_reader()
+        results = con.execute(f"SELECT MAX(fetched_at), COUNT(Symbol) FROM {source}").fetchone()
         con.close()
         if results and results[0]:
             return {"last_refresh": results[0], "company_count": results[1]}
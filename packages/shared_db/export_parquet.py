@@ -0,0 +1,75 @@
+# db/export_parquet.py
+"""
+Write read-mostly tables out as zstd Parquet snapshots.
+
+Analytics readers scan the Parquet file with read_parquet() on an in-memory
+connection instead of opening the DuckDB file, so they get compressed
+columnar scans and never contend with the writer's file lock.
+
+    python -m packages.shared_db.export_parquet
+"""
+import os
+import sys
+from pathlib import Path
+
+import duckdb
+
+if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+    _ROOT_DIR = Path(sys._MEIPASS)
+else:
+    _ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(_ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(_ROOT_DIR))
+
+from config.paths import DB_DIR, SCREENER_DB, FUNDAMENTALS_DB  # noqa: E402
+
+COMPANIES_PARQUET = DB_DIR / "companies.parquet"
+FUNDAMENTALS_PARQUET = DB_DIR / "fundamentals.parquet"
+
+ROW_GROUP_SIZE = 100_000
+
+
+def _sql_path(path: Path) -> str:
+    """`path` as a quoted SQL string literal (COPY TO can't take a parameter)."""
+    return "'" + Path(path).as_posix().replace("'", "''") + "'"
+
+
+def export_table(con, table: str, path: Path) -> None:
+    """
+    COPY `table` to `path` as Parquet. Written to a temp file and renamed so
+    readers never see a half-written snapshot.
+    """
+    tmp_path = Path(str(path) + ".tmp")
+    con.execute(
+        f"COPY {table} TO {_sql_path(tmp_path)} "
+        f"(FORMAT PARQUET, COMPRESSION zstd, ROW_GROUP_SIZE {ROW_GROUP_SIZE})"
+    )
+    os.replace(tmp_path, path)
+
+
+def parquet_source(path: Path) -> str:
+    """FROM-clause expression for scanning a snapshot written by export_table."""
+    return f"read_parquet({_sql_path(path)})"
+
+
+def export_snapshots() -> None:
+    """Export companies (screener DB) and fundamentals (fundamentals DB)."""
+    for db_path, table, out_path in (
+        (SCREENER_DB, "companies", COMPANIES_PARQUET),
+        (FUNDAMENTALS_DB, "fundamentals", FUNDAMENTALS_PARQUET),
+    ):
+        if not db_path.exists():
+            print(f"⚠️ {db_path} not found, skipping {table}")
+            continue
+        con = duckdb.connect(str(db_path), read_only=True)
+        try:
+            export_table(con, table, out_path)
+            print(f"✅ Exported {table} → {out_path}")
+        except duckdb.CatalogException:
+            print(f"⚠️ Table {table} not found in {db_path}, skipping")
+        finally:
+            con.close()
+
+
+if __name__ == "__main__":
+    export_snapshots()
@@ -0,0 +1,88 @@
+# db/writer.py
+"""
+Background DuckDB writer so scraping never waits on inserts/commits.
+
+BackgroundWriter has the same write methods as RawJsonWriter, but they only
+enqueue the row. A single daemon thread owns a RawJsonWriter (and its DuckDB
+cursor), serializes payloads, and flushes whenever the queue goes idle for
+`flush_interval` seconds or `batch_size` rows have been buffered:
+
+    with BackgroundWriter() as writer:
+        writer.upsert_company(company_id, warehouse_id, name, url)
+        writer.store_raw_json(company_id, url, payload)
+"""
+import queue
+import threading
+from typing import Optional
+
+from packages.shared_db.db_utils import RawJsonWriter
+
+_STOP = object()
+
+
+class BackgroundWriter:
+    def __init__(self, batch_size: int = 10_000, flush_interval: float = 0.5):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="duckdb-background-writer", daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(self, kind: str, *args) -> None:
+        """Queue a write; kind is 'company', 'raw_json' or 'failed'."""
+        if self._error is not None:
+            raise RuntimeError("Background writer stopped") from self._error
+        self._queue.put((kind, args))
+
+    def upsert_company(self, company_id, warehouse_id, name, url) -> None:
+        self.enqueue("company", company_id, warehouse_id, name, url)
+
+    def store_raw_json(self, company_id, url, payload) -> None:
+        self.enqueue("raw_json", company_id, url, payload)
+
+    def mark_failed_company(
+        self,
+        company_id: Optional[str],
+        source_url: str,
+        failure_reason: str,
+    ) -> None:
+        self.enqueue("failed", company_id, source_url, failure_reason)
+
+    def _run(self) -> None:
+        try:
+            writer = RawJsonWriter(batch_size=self.batch_size)
+            handlers = {
+                "company": writer.upsert_company,
+                "raw_json": writer.store_raw_json,
+                "failed": writer.mark_failed_company,
+            }
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    writer.flush_pending()
+                    continue
+                if item is _STOP:
+                    writer.close()
+                    return
+                kind, args = item
+                handlers[kind](*args)
+        except BaseException as error:  # surfaced to the producer on enqueue/close
+            self._error = error
+
+    def close(self) -> None:
+        """Drain the queue, flush everything and stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._error is not None:
+            raise RuntimeError("Background writer failed") from self._error
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -27,7 +27,7 @@ def load_ohlcv_dataframe(
     if not bars:
         raise ValueError(f"No historical data available for {symbol} on {timeframe}.")
 
-    frame = pd.DataFrame(bars)
+    # Build only the OHLCV columns up front; sort_values already returns a new frame
+    frame = pd.DataFrame(bars, columns=["time", "open", "high", "low", "close", "volume"])
     frame["time"] = pd.to_datetime(frame["time"], unit="ms", utc=True)
-    frame = frame.sort_values("time").reset_index(drop=True)
-    return frame[["time", "open", "high", "low", "close", "volume"]].copy()
+    return frame.sort_values("time", ignore_index=True)
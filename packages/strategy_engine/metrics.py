@@ -9,7 +9,7 @@ def build_metrics(*, equity_curve: list[dict], trades: list[dict], initial_cash:
     if not equity_curve:
         return {}
 
-    frame = pd.DataFrame(equity_curve).copy()
+    frame = pd.DataFrame(equity_curve)
     frame["equity"] = frame["equity"].astype(float)
     frame["returns"] = frame["equity"].pct_change().fillna(0.0)
 
@@ -50,16 +50,16 @@ def build_metrics(*, equity_curve: list[dict], trades: list[dict], initial_cash:
 def build_drawdown_curve(equity_curve: list[dict]) -> list[dict]:
     if not equity_curve:
         return []
-    frame = pd.DataFrame(equity_curve).copy()
+    frame = pd.DataFrame(equity_curve)
     frame["equity"] = frame["equity"].astype(float)
     frame["running_max"] = frame["equity"].cummax()
     frame["drawdown"] = ((frame["equity"] / frame["running_max"]) - 1.0) * 100
     return [
         {
-            "time": row["time"],
-            "drawdown": round(float(row["drawdown"]), 4),
+            "time": time_value,
+            "drawdown": round(drawdown, 4),
         }
-        for _, row in frame.iterrows()
+        for time_value, drawdown in zip(frame["time"].tolist(), frame["drawdown"].tolist())
     ]
 
 
@@ -309,7 +309,7 @@ class StrategyRunner:
                 "close": "Close",
                 "volume": "Volume",
             }
-        ).copy()
+        )
         normalized = normalized.set_index("time")
         ScriptedStrategy = compile_strategy_class(request.strategy_code)
 
@@ -369,7 +369,7 @@ class StrategyRunner:
                 "close": "Close",
                 "volume": "Volume",
             }
-        ).copy()
+        )
         normalized = normalized.set_index("time")
         grid_specs = {key: value for key, value in parameter_grid.items() if key != "_constraints"}
         parameter_values = {key: _expand_parameter_spec(value) for key, value in grid_specs.items()}
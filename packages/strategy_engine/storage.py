@@ -293,30 +293,26 @@ def delete_backtest_run(run_id: str) -> bool:
 
 def create_or_update_paper_session(payload: dict) -> dict:
     session_id = payload["session_id"]
-    existing = get_paper_session(session_id)
+    status = payload.get("status")
+    payload_json = json.dumps(payload)
     conn = _connect()
     now = _now()
     try:
-        if existing is None:
-            conn.execute(
-                """
-                INSERT INTO paper_sessions (session_id, status, payload_json, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                [session_id, payload.get("status", "running"), json.dumps(payload), now, now],
-            )
-        else:
-            conn.execute(
-                """
-                UPDATE paper_sessions
-                SET status = ?, payload_json = ?, updated_at = ?
-                WHERE session_id = ?
-                """,
-                [payload.get("status", existing.get("status", "running")), json.dumps(payload), now, session_id],
-            )
+        conn.execute(
+            """
+            INSERT INTO paper_sessions (session_id, status, payload_json, created_at, updated_at)
+            VALUES (?, COALESCE(?, 'running'), ?, ?, ?)
+            ON CONFLICT(session_id) DO UPDATE SET
+                status = COALESCE(?, paper_sessions.status),
+                payload_json = EXCLUDED.payload_json,
+                updated_at = EXCLUDED.updated_at
+            """,
+            [session_id, status, payload_json, now, now, status],
+        )
     finally:
         conn.close()
-    return get_paper_session(session_id)
+    # Same value get_paper_session would read back, without reconnecting
+    return json.loads(payload_json)
 
 
 def get_paper_session(session_id: str) -> dict | None:
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Make the repo root importable (packages.*, config.*) when running `pytest`
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
@@ -0,0 +1,118 @@
+"""
+cached_get: fresh hits stay off the network, stale entries are revalidated,
+replay never fetches, and only 200 responses are stored.
+"""
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+from packages.screener_client import cache
+
+URL = "https://www.screener.in/company/TEST/consolidated/"
+TTL = 60
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "SCREENER_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def _get(handler, url=URL, ttl=TTL):
+    """cached_get(url) over a mock transport; returns (response, requests seen)."""
+    seen = []
+
+    def record(request):
+        seen.append(request)
+        return handler(request)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(record)) as client:
+            return await cache.cached_get(client, url, ttl)
+
+    return asyncio.run(run()), seen
+
+
+def _ok(request):
+    return httpx.Response(200, headers={"ETag": '"v1"'}, content=b"<html>page</html>")
+
+
+def _backdate(path, seconds):
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def _age(url, seconds):
+    """Backdate the cache entry for `url` by `seconds`."""
+    _backdate(cache._cache_path(url), seconds)
+
+
+def test_fresh_entry_is_served_from_disk():
+    first, seen = _get(_ok)
+    assert first.content == b"<html>page</html>" and len(seen) == 1
+
+    second, seen = _get(_ok)
+    assert seen == []
+    assert second.status_code == 200
+    assert second.content == b"<html>page</html>"
+    assert second.headers["ETag"] == '"v1"'
+
+
+def test_stale_entry_is_revalidated_with_304():
+    _get(_ok)
+    _age(URL, TTL + 1)
+
+    def not_modified(request):
+        assert request.headers["If-None-Match"] == '"v1"'
+        return httpx.Response(304)
+
+    response, seen = _get(not_modified)
+    assert len(seen) == 1
+    assert response.status_code == 200
+    assert response.content == b"<html>page</html>"
+
+    # The 304 renewed the entry: the next call is a fresh hit
+    _, seen = _get(not_modified)
+    assert seen == []
+
+
+def test_replay_miss_raises_without_fetching():
+    with cache.cache_mode("replay"):
+        with pytest.raises(cache.CacheMiss):
+            _get(_ok)
+
+
+def test_replay_serves_stale_entries():
+    _get(_ok)
+    _age(URL, 10 * TTL)
+    with cache.cache_mode("replay"):
+        response, seen = _get(_ok)
+    assert seen == [] and response.content == b"<html>page</html>"
+
+
+@pytest.mark.parametrize("status", [404, 429, 500])
+def test_only_200_is_stored(status):
+    response, _ = _get(lambda request: httpx.Response(status, content=b"nope"))
+    assert response.status_code == status
+    assert not cache._cache_path(URL).exists()
+
+    _, seen = _get(_ok)
+    assert len(seen) == 1
+
+
+def test_prune_drops_entries_older_than_max_ttl(cache_dir):
+    old_url = URL + "old"
+    _get(_ok)
+    _get(_ok, url=old_url)
+    _age(old_url, cache.MAX_TTL + 1)
+    leftover = cache_dir / "leftover.body.123.tmp"
+    leftover.write_bytes(b"")
+    _backdate(leftover, cache.MAX_TTL + 1)
+
+    assert cache.prune_cache() == 2
+    assert cache._cache_path(URL).exists()
+    assert not cache._cache_path(old_url).exists()
+    assert not leftover.exists()
@@ -0,0 +1,85 @@
+"""
+The lxml table reader must give the rows the old pd.read_html extractor
+gave (blanks aside: they were float NaN and are None now).
+"""
+import math
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from lxml import html as lxml_html
+
+from packages.screener_client.fetch import TABLE_SECTIONS
+from packages.screener_client.html_scraper import _TABLE_AFTER, extract_all_tables, extract_table
+
+FIXTURE = Path(__file__).parent / "fixtures" / "company_page.html"
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return lxml_html.fromstring(FIXTURE.read_bytes())
+
+
+def _read_html_rows(table) -> list[dict]:
+    """The extractor before the lxml rewrite: read_html, then its clean-up."""
+    df = pd.read_html(StringIO(lxml_html.tostring(table, encoding="unicode")))[0]
+    df.rename(columns={df.columns[0]: "Item"}, inplace=True)
+    if len(df.columns) > 1:
+        df.dropna(axis=0, how="all", subset=df.columns[1:], inplace=True)
+    # astype(str) under the locked pandas 2.x: a blank Item reads "nan"
+    df["Item"] = df["Item"].map(str).str.strip()
+    df.reset_index(drop=True, inplace=True)
+    return [
+        {key: None if isinstance(value, float) and math.isnan(value) else value for key, value in row.items()}
+        for row in df.to_dict(orient="records")
+    ]
+
+
+def _heading_table(tree, header_text):
+    heading = next(h for h in tree.iter("h2", "h3", "h4") if header_text.lower() in h.text_content().lower())
+    return _TABLE_AFTER(heading)[0]
+
+
+@pytest.mark.parametrize("header_text", list(TABLE_SECTIONS.values()))
+def test_tables_match_read_html(tree, header_text):
+    expected = _read_html_rows(_heading_table(tree, header_text))
+    rows = extract_all_tables(tree, [header_text])[header_text]
+    assert rows == expected
+    # Same Python types too (int vs float vs str vs bool)
+    assert [[type(v) for v in row.values()] for row in rows] == [
+        [type(v) for v in row.values()] for row in expected
+    ]
+
+
+def test_fixture_covers_read_html_rules(tree):
+    tables = extract_all_tables(tree, TABLE_SECTIONS.values())
+
+    quarterly = tables["Quarterly Results"]
+    assert [row["Item"] for row in quarterly][-1] == "EPS in Rs"  # NA-only rows dropped
+    assert quarterly[0]["Dec 2023"] == "110577"  # text column: commas dropped
+    assert quarterly[3]["Mar 2024"] is None and quarterly[3]["Jun 2024"] == "1e3"
+
+    profit_loss = tables["Profit & Loss"]
+    assert list(profit_loss[0]) == ["Item", "FY", "FY.1", "TTM"]  # colspan expanded
+    assert profit_loss[0]["TTM"] == "440000"
+    assert profit_loss[2]["Item"] == "Net Profit +"  # rowspan carried down
+    assert profit_loss[3]["FY.1"] == "6% (interim)"
+
+    cash_flows = tables["Cash Flows"]
+    assert [row["Unnamed: 3"] for row in cash_flows] == [None, 12.0, 1000.0]
+    assert cash_flows[2]["Item"] == "nan"
+
+    assert tables["Ratios"][0] == {"Item": "Debtor Days", 1: "14", 2: "12"}  # no header: numbered columns
+    assert tables["Balance Sheet"][-1]["Mar 2023"] == "1_000"
+
+
+def test_missing_section_is_empty(tree):
+    assert extract_all_tables(tree, ["Peer Comparison"]) == {"Peer Comparison": []}
+    assert extract_table(tree, "Peer Comparison") == []
+
+
+def test_extract_table_matches_extract_all_tables(tree):
+    tables = extract_all_tables(tree, TABLE_SECTIONS)
+    for section in TABLE_SECTIONS:
+        assert extract_table(tree, section) == tables[section]